@@ -1,5 +1,6 @@
 import json
 from datetime import datetime
+from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
 import os
 
@@ -64,6 +65,18 @@ class LocalStorageCache:
                 span.set_attribute("cache.bytes_read", len(data))
                 return data
 
+    def local_path(self, key: str) -> str | None:
+        """
+        Return the on-disk path of a cached item when the cache lives on the
+        local filesystem, so large entries can be opened in place instead of
+        being read into memory. Returns None for remote backends or if the
+        item is not cached.
+        """
+        if not isinstance(self.fs, LocalFileSystem):
+            return None
+        path = f"{self.cache_dir}/{key}"
+        return path if self.fs.exists(path) else None
+
     def put(self, key: str, data: bytes, metadata: dict = None) -> str:
         """
         Store the given data under the key and return its path.
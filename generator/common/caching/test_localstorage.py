@@ -119,3 +119,21 @@ def test_put_metadata(cache):
         loaded_metadata = json.load(f)
 
     assert loaded_metadata == metadata
+
+
+def test_local_path_returns_path_of_cached_item(cache):
+    path = cache.put("nested/item.bin", b"data")
+    assert cache.local_path("nested/item.bin") == path
+    assert cache.local_path("missing.bin") is None
+
+
+def test_local_path_is_none_for_remote_backends(cache_dir):
+    class RemoteFileSystem:
+        def makedirs(self, path, exist_ok=False):
+            pass
+
+        def exists(self, path):
+            return True
+
+    remote_cache = LocalStorageCache(RemoteFileSystem(), str(cache_dir))
+    assert remote_cache.local_path("item.bin") is None
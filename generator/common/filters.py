@@ -117,6 +117,21 @@ class FilterParser:
             )
 
 
+def _parse_filter_items(
+    items: list,
+) -> List[Union[PropertyFilter, FilterGroup]]:
+    """Parse filter strings in a list, keeping already-parsed filter objects.
+
+    Items of any other type are ignored.
+    """
+    parse = FilterParser.parse_simple_filter
+    return [
+        item if isinstance(item, (PropertyFilter, FilterGroup)) else parse(item)
+        for item in items
+        if isinstance(item, (str, PropertyFilter, FilterGroup))
+    ]
+
+
 def parse_filters(
     filters_param: Union[str, list, dict, PropertyFilter, FilterGroup, None],
 ) -> Optional[Union[PropertyFilter, FilterGroup]]:
@@ -144,12 +159,7 @@ def parse_filters(
         # List of filter strings or objects - combine with AND logic
         if not filters_param:
             return None
-        parsed_filters = []
-        for f in filters_param:
-            if isinstance(f, (PropertyFilter, FilterGroup)):
-                parsed_filters.append(f)
-            elif isinstance(f, str):
-                parsed_filters.append(FilterParser.parse_simple_filter(f))
+        parsed_filters = _parse_filter_items(filters_param)
 
         if len(parsed_filters) == 1:
             return parsed_filters[0]
@@ -162,12 +172,7 @@ def parse_filters(
             filter_list = filters_param["filters"]
             operator = filters_param.get("operator", "AND")
 
-            parsed_filters = []
-            for f in filter_list:
-                if isinstance(f, (PropertyFilter, FilterGroup)):
-                    parsed_filters.append(f)
-                elif isinstance(f, str):
-                    parsed_filters.append(FilterParser.parse_simple_filter(f))
+            parsed_filters = _parse_filter_items(filter_list)
 
             if not parsed_filters:
                 return None
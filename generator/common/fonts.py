@@ -1,3 +1,4 @@
+import functools
 import importlib.resources
 import os
 from pathlib import Path
@@ -11,10 +12,14 @@ FONTS_DIR = Path(__file__).parent.parent.parent / "fonts"
 tracer = get_tracer(__name__)
 
 
+@functools.lru_cache(maxsize=16)
 def resolve_font(font_name: str) -> fitz.Font:
     """
     Load a font from package resources.
     If it fails, log a warning and fall back to a built-in font.
+
+    Fonts are cached per name, since callers such as the difficulty wheel
+    resolve the same font once per song.
     """
     try:
         # Standard way to load package resources, works when installed
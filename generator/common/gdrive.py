@@ -1,9 +1,17 @@
 from typing import Generator, List, Dict, Optional, Set, Union
 from datetime import datetime
 import click
-from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+from googleapiclient.http import (
+    HttpRequest,
+    MediaIoBaseDownload,
+    MediaIoBaseUpload,
+    build_http,
+)
 from googleapiclient.errors import HttpError
 import io
+import threading
+import google_auth_httplib2
+import httplib2
 from loguru import logger
 from opentelemetry import trace
 from googleapiclient.discovery import build
@@ -16,12 +24,39 @@ from google.auth import credentials
 
 SHORTCUT_MIME_TYPE = "application/vnd.google-apps.shortcut"
 
+# Drive accepts at most 100 calls in a single batch request.
+_METADATA_BATCH_SIZE = 100
+_FILE_METADATA_FIELDS = "id,name,parents,properties,mimeType"
+
 tracer = get_tracer(__name__)
 
 
+def build_service(name: str, version: str, credentials: credentials.Credentials):
+    """
+    Build a Google API client from credentials.
+
+    httplib2 connections are not thread-safe, so requests are bound to a
+    connection owned by the calling thread. This lets the client be shared
+    by worker threads while each thread keeps reusing its own connection.
+    """
+    local = threading.local()
+
+    def _request_builder(http, *args, **kwargs):
+        thread_http = getattr(local, "http", None)
+        if thread_http is None:
+            thread_http = local.http = google_auth_httplib2.AuthorizedHttp(
+                credentials, http=build_http()
+            )
+        return HttpRequest(thread_http, *args, **kwargs)
+
+    return build(
+        name, version, credentials=credentials, requestBuilder=_request_builder
+    )
+
+
 def client(credentials: credentials.Credentials):
-    """Build a Google Drive API client from credentials."""
-    return build("drive", "v3", credentials=credentials)
+    """Build a Google Drive API client from credentials (see build_service)."""
+    return build_service("drive", "v3", credentials)
 
 
 def _build_property_filters(property_filters: Optional[Dict[str, str]]) -> str:
@@ -251,6 +286,15 @@ class GoogleDriveClient:
             with self.download_file_stream(f, use_cache=use_cache) as stream:
                 yield stream.getvalue()
 
+    def get_modified_time(self, file_id: str) -> datetime:
+        """Return the time a Drive file was last modified."""
+        details = (
+            self.drive.files()
+            .get(fileId=file_id, fields="modifiedTime")
+            .execute(num_retries=self.config.api_retries)
+        )
+        return datetime.fromisoformat(details["modifiedTime"].replace("Z", "+00:00"))
+
     def download_file(
         self,
         file_id: str,
@@ -271,14 +315,7 @@ class GoogleDriveClient:
         span.set_attribute("cache.key", cache_key)
 
         if use_cache:
-            details = (
-                self.drive.files()
-                .get(fileId=file_id, fields="modifiedTime")
-                .execute(num_retries=self.config.api_retries)
-            )
-            remote_ts = datetime.fromisoformat(
-                details["modifiedTime"].replace("Z", "+00:00")
-            )
+            remote_ts = self.get_modified_time(file_id)
             span.set_attribute("gdrive.remote_modified_time", str(remote_ts))
 
             try:
@@ -335,15 +372,22 @@ class GoogleDriveClient:
         Returns:
             List of file objects with metadata
         """
+        # Fetch several files in as few round-trips as possible; anything the
+        # batch didn't return is fetched on its own below, with retries.
+        batched_metadata = (
+            self._batch_get_files_metadata(file_ids) if len(file_ids) > 1 else {}
+        )
+
         files = []
         for file_id in file_ids:
             try:
-                # Get file metadata from Drive
-                file_metadata = (
-                    self.drive.files()
-                    .get(fileId=file_id, fields="id,name,parents,properties,mimeType")
-                    .execute(num_retries=self.config.api_retries)
-                )
+                file_metadata = batched_metadata.get(file_id)
+                if file_metadata is None:
+                    file_metadata = (
+                        self.drive.files()
+                        .get(fileId=file_id, fields=_FILE_METADATA_FIELDS)
+                        .execute(num_retries=self.config.api_retries)
+                    )
                 file_obj = File(
                     id=file_id,
                     name=file_metadata.get("name", f"file_{file_id}"),
@@ -368,6 +412,46 @@ class GoogleDriveClient:
 
         return files
 
+    def _batch_get_files_metadata(self, file_ids: List[str]) -> Dict[str, dict]:
+        """
+        Get metadata for several files using Drive batch requests.
+
+        Files whose request failed are left out of the result, so that the
+        caller can retry them individually.
+
+        Args:
+            file_ids: List of Google Drive file IDs
+
+        Returns:
+            Dict mapping file ID to its metadata
+        """
+        metadata_by_id = {}
+
+        def _on_response(request_id, response, exception):
+            if exception is None:
+                metadata_by_id[request_id] = response
+
+        # Request IDs must be unique within a batch.
+        unique_ids = list(dict.fromkeys(file_ids))
+        for i in range(0, len(unique_ids), _METADATA_BATCH_SIZE):
+            batch = self.drive.new_batch_http_request(callback=_on_response)
+            for file_id in unique_ids[i : i + _METADATA_BATCH_SIZE]:
+                batch.add(
+                    self.drive.files().get(
+                        fileId=file_id, fields=_FILE_METADATA_FIELDS
+                    ),
+                    request_id=file_id,
+                )
+            # Unlike single requests, a batch can't be executed with
+            # num_retries, so a failed batch is skipped here and its files are
+            # retried one by one by the caller.
+            try:
+                batch.execute()
+            except (HttpError, OSError, httplib2.HttpLib2Error) as e:
+                click.echo(f"Warning: Batch metadata request failed: {e}")
+
+        return metadata_by_id
+
     def download_file_bytes(self, file: File, use_cache: bool = True) -> bytes:
         """
         Legacy function for backward compatibility.
@@ -1,6 +1,8 @@
 """Song sheet source abstraction: Drive for file existence, Firestore for properties."""
 
-from typing import List, Optional, Union
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 
 from .gdrive import GoogleDriveClient
 from .metadata_store import SongMetadataStore
@@ -35,15 +37,26 @@ class SongSheetSource:
         Drive and Firestore mirror properties 1:1, so client-side filtering (which
         uses properties) produces the same result regardless of which source is active.
         """
-        files = self._gdrive.query_drive_files_with_client_filter(
-            source_folders, client_filter
-        )
-        if self._metadata_store is not None:
-            self._overlay_properties(files)
+        if self._metadata_store is None:
+            return self._gdrive.query_drive_files_with_client_filter(
+                source_folders, client_filter
+            )
+
+        # The Drive listing and the Firestore read are independent, so read the
+        # metadata on a second thread while Drive is being listed.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            metadata_future = executor.submit(
+                contextvars.copy_context().run, self._metadata_store.get_all
+            )
+            files = self._gdrive.query_drive_files_with_client_filter(
+                source_folders, client_filter
+            )
+            all_metadata = metadata_future.result()
+        self._overlay_properties(files, all_metadata)
         return files
 
-    def _overlay_properties(self, files: List[File]) -> None:
-        all_metadata = self._metadata_store.get_all()
+    @staticmethod
+    def _overlay_properties(files: List[File], all_metadata: Dict[str, dict]) -> None:
         for file in files:
             if file.id in all_metadata:
                 file.properties = all_metadata[file.id].get("properties", {})
@@ -139,3 +139,13 @@ def test_filter_by_name_equals():
     f = PropertyFilter(key="name", operator=FilterOperator.EQUALS, value="Hey Jude")
     assert f.matches({"name": "Hey Jude"})
     assert not f.matches({"name": "Yellow Submarine"})
+
+
+def test_parse_filters_list_keeps_objects_and_skips_unknown_items():
+    """Parsed filter objects are kept in order; unsupported items are ignored."""
+    existing = PropertyFilter(key="artist", operator=FilterOperator.EQUALS, value="X")
+    result = parse_filters([existing, 42, "year:gte:2000"])
+    assert isinstance(result, FilterGroup)
+    assert result.filters[0] is existing
+    assert result.filters[1].key == "year"
+    assert len(result.filters) == 2
@@ -5,6 +5,13 @@ import os
 from .fonts import resolve_font
 
 
+@pytest.fixture(autouse=True)
+def clear_font_cache():
+    resolve_font.cache_clear()
+    yield
+    resolve_font.cache_clear()
+
+
 @patch("importlib.resources.files")
 @patch("fitz.Font")
 def test_resolve_font_from_package_resources(mock_fitz_font, mock_importlib_files):
@@ -52,3 +59,21 @@ def test_resolve_font_total_failure(mock_open, mock_importlib_files):
         resolve_font("NonExistentFont.ttf")
 
     assert "Font file not found for: NonExistentFont.ttf" in str(excinfo.value)
+
+
+@patch("importlib.resources.files")
+@patch("fitz.Font")
+def test_resolve_font_is_cached_per_name(mock_fitz_font, mock_importlib_files):
+    """Each font is read and parsed once, however often it is resolved."""
+    mock_importlib_files.return_value.joinpath.return_value.read_bytes.return_value = (
+        b"font_data"
+    )
+    mock_fitz_font.side_effect = lambda fontbuffer: MagicMock()
+
+    first = resolve_font("SomeFont.ttf")
+    second = resolve_font("SomeFont.ttf")
+    other = resolve_font("OtherFont.ttf")
+
+    assert first is second
+    assert other is not first
+    assert mock_fitz_font.call_count == 2
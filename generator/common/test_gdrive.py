@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import Mock, patch
-from .gdrive import GoogleDriveClient, _build_property_filters
+from .gdrive import GoogleDriveClient, _build_property_filters, client
 from .config import GoogleDriveClientConfig
 
 
@@ -1060,3 +1060,153 @@ def test_create_shortcut_uses_api_retries(mock_drive_client):
     mock_drive_client.drive.files.return_value.create.return_value.execute.assert_called_once_with(
         num_retries=3
     )
+
+
+# ---------------------------------------------------------------------------
+# get_files_metadata_by_ids tests
+# ---------------------------------------------------------------------------
+
+
+class _FakeBatch:
+    """Stands in for a Drive BatchHttpRequest, answering from *responses*."""
+
+    def __init__(self, callback, responses):
+        self.callback = callback
+        self.responses = responses
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            response = self.responses.get(request_id)
+            if isinstance(response, Exception):
+                self.callback(request_id, None, response)
+            else:
+                self.callback(request_id, response, None)
+
+
+def _install_fake_batches(drive_client, responses):
+    batches = []
+
+    def _new_batch(callback):
+        batches.append(_FakeBatch(callback, responses))
+        return batches[-1]
+
+    drive_client.drive.new_batch_http_request.side_effect = _new_batch
+    return batches
+
+
+def test_get_files_metadata_by_ids_batches_requests(mock_drive_client):
+    """Several IDs are fetched in one batch and returned in request order."""
+    responses = {
+        "b": {"id": "b", "name": "Song B", "properties": {"artist": "X"}},
+        "a": {"id": "a", "name": "Song A", "mimeType": "application/pdf"},
+    }
+    batches = _install_fake_batches(mock_drive_client, responses)
+
+    result = mock_drive_client.get_files_metadata_by_ids(["b", "a"])
+
+    assert [f.id for f in result] == ["b", "a"]
+    assert result[0].properties == {"artist": "X"}
+    assert result[1].mimeType == "application/pdf"
+    assert len(batches) == 1
+    assert batches[0].request_ids == ["b", "a"]
+    mock_drive_client.drive.files.return_value.get.return_value.execute.assert_not_called()
+
+
+def test_get_files_metadata_by_ids_splits_large_batches(mock_drive_client):
+    """Drive's per-batch limit is respected."""
+    from .gdrive import _METADATA_BATCH_SIZE
+
+    file_ids = [f"id{i}" for i in range(_METADATA_BATCH_SIZE + 1)]
+    responses = {fid: {"id": fid, "name": fid} for fid in file_ids}
+    batches = _install_fake_batches(mock_drive_client, responses)
+
+    result = mock_drive_client.get_files_metadata_by_ids(file_ids)
+
+    assert [f.id for f in result] == file_ids
+    assert [len(b.request_ids) for b in batches] == [_METADATA_BATCH_SIZE, 1]
+
+
+@patch("generator.common.gdrive.click.echo")
+def test_get_files_metadata_by_ids_retries_failed_batch_items(
+    mock_echo, mock_drive_client
+):
+    """Files that failed in the batch are fetched individually with retries."""
+    from googleapiclient.errors import HttpError
+    from unittest.mock import MagicMock
+
+    responses = {
+        "a": {"id": "a", "name": "Song A"},
+        "b": HttpError(resp=MagicMock(status=500), content=b"Backend Error"),
+    }
+    _install_fake_batches(mock_drive_client, responses)
+    get_request = mock_drive_client.drive.files.return_value.get
+    get_request.return_value.execute.return_value = {"id": "b", "name": "Song B"}
+
+    result = mock_drive_client.get_files_metadata_by_ids(["a", "b"])
+
+    assert [f.name for f in result] == ["Song A", "Song B"]
+    get_request.assert_called_with(
+        fileId="b", fields="id,name,parents,properties,mimeType"
+    )
+    get_request.return_value.execute.assert_called_once_with(num_retries=3)
+
+
+@patch("generator.common.gdrive.click.echo")
+def test_get_files_metadata_by_ids_retries_after_batch_transport_error(
+    mock_echo, mock_drive_client
+):
+    """A batch that fails to send falls back to fetching each file with retries."""
+    batch = mock_drive_client.drive.new_batch_http_request.return_value
+    batch.execute.side_effect = ConnectionError("connection reset")
+    get_request = mock_drive_client.drive.files.return_value.get
+    get_request.return_value.execute.side_effect = [
+        {"id": "a", "name": "Song A"},
+        {"id": "b", "name": "Song B"},
+    ]
+
+    result = mock_drive_client.get_files_metadata_by_ids(["a", "b"])
+
+    assert [f.name for f in result] == ["Song A", "Song B"]
+    assert [c.kwargs["fileId"] for c in get_request.call_args_list[-2:]] == ["a", "b"]
+    assert get_request.return_value.execute.call_count == 2
+    get_request.return_value.execute.assert_called_with(num_retries=3)
+
+
+def test_get_files_metadata_by_ids_single_id_skips_batch(mock_drive_client):
+    """A single ID is fetched directly."""
+    get_request = mock_drive_client.drive.files.return_value.get
+    get_request.return_value.execute.return_value = {"id": "a", "name": "Song A"}
+
+    result = mock_drive_client.get_files_metadata_by_ids(["a"])
+
+    assert [f.name for f in result] == ["Song A"]
+    mock_drive_client.drive.new_batch_http_request.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# client tests
+# ---------------------------------------------------------------------------
+
+
+def test_client_binds_requests_to_a_connection_per_thread():
+    """Requests reuse their thread's connection and never share another's."""
+    import threading
+    from google.oauth2.credentials import Credentials
+
+    drive = client(Credentials(token="token"))
+
+    first = drive.files().get(fileId="a")
+    second = drive.files().get(fileId="b")
+    from_thread = []
+    thread = threading.Thread(
+        target=lambda: from_thread.append(drive.files().get(fileId="c"))
+    )
+    thread.start()
+    thread.join()
+
+    assert first.http is second.http
+    assert from_thread[0].http is not first.http
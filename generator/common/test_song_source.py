@@ -69,3 +69,30 @@ def test_client_filter_is_passed_through_to_drive():
     gdrive.query_drive_files_with_client_filter.assert_called_once_with(
         ["folder1"], client_filter
     )
+
+
+def test_firestore_read_overlaps_drive_listing():
+    """Firestore metadata is read while Drive is listing files."""
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+    files = [File(id="a", name="Song A", properties={})]
+
+    gdrive = Mock(spec=GoogleDriveClient)
+
+    def _list_files(source_folders, client_filter):
+        both_started.wait()
+        return files
+
+    gdrive.query_drive_files_with_client_filter.side_effect = _list_files
+    store = Mock(spec=SongMetadataStore)
+
+    def _get_all():
+        both_started.wait()
+        return {"a": {"properties": {"status": "APPROVED"}}}
+
+    store.get_all.side_effect = _get_all
+
+    result = SongSheetSource(gdrive, store).collect_files(["folder1"])
+
+    assert result[0].properties == {"status": "APPROVED"}
@@ -1,3 +1,6 @@
+import functools
+from datetime import date
+
 import click
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -20,6 +23,20 @@ def _next_tuesday(when):
     return when.shift(days=(1 - when.weekday()) % 7)
 
 
+@functools.lru_cache(maxsize=1)
+def _formatted_cover_dates(today: date) -> tuple[str, str]:
+    """Format `today` and its upcoming Tuesday for the cover placeholders.
+
+    Cached per calendar day so that repeated builds in the same process skip
+    arrow's locale-aware formatter.
+    """
+    when = arrow.get(today)
+    return (
+        when.format("Do MMMM YYYY"),
+        _next_tuesday(when).format("Do MMMM YYYY"),
+    )
+
+
 class CoverGenerator:
     def __init__(
         self,
@@ -27,11 +44,18 @@ class CoverGenerator:
         docs_service,
         cover_config: config.Cover,
         enable_templating=True,
+        cache=None,
     ):
+        """
+        If a cache is given, the templated cover is cached, so the templating
+        round-trips and export are skipped until the source document changes
+        or the date does.
+        """
         self.gdrive_client = gdrive_client
         self.docs = docs_service
         self.config = cover_config
         self.enable_templating = enable_templating
+        self.cache = cache
 
     def _apply_template_replacements(self, document_id: str, replacement_map: dict):
         """
@@ -39,17 +63,17 @@ class CoverGenerator:
 
         Returns a mapping of each placeholder to the number of occurrences that
         were replaced (0 when the placeholder is absent). If the update fails, it
-        logs an error, continues gracefully, and returns an empty mapping.
+        logs an error, continues gracefully, and returns None.
         """
         placeholders = list(replacement_map.keys())
         requests = [
             {
                 "replaceAllText": {
                     "containsText": {"text": placeholder, "matchCase": True},
-                    "replaceText": replacement_map[placeholder],
+                    "replaceText": replacement_text,
                 }
             }
-            for placeholder in placeholders
+            for placeholder, replacement_text in replacement_map.items()
         ]
 
         try:
@@ -67,7 +91,7 @@ class CoverGenerator:
                 f"Error: {e}",
                 err=True,
             )
-            return {}
+            return None
 
         # Replies are returned in the same order as the requests we sent.
         replies = result.get("replies", []) if isinstance(result, dict) else []
@@ -84,6 +108,18 @@ class CoverGenerator:
         return counts
 
     def generate_cover(self, cover_file_id=None):
+        pdf_data = self.fetch_cover_pdf(cover_file_id)
+        if pdf_data is None:
+            return None
+        return open_cover_pdf(pdf_data)
+
+    def fetch_cover_pdf(self, cover_file_id=None):
+        """
+        Return the cover as PDF bytes, or None if no cover is configured.
+
+        Only talks to Google Docs/Drive and never calls into PyMuPDF, which is
+        not thread-safe, so it can run on a background thread.
+        """
         if not cover_file_id:
             cover_file_id = self.config.file_id
             if not cover_file_id:
@@ -91,26 +127,39 @@ class CoverGenerator:
                 return None
 
         if self.enable_templating:
-            today = arrow.now()
+            now = arrow.now()
+            cover_date = now.date()
+            # One rendered copy per cover, overwritten when it goes stale.
+            rendered_key = f"covers/{cover_file_id}-rendered.pdf"
+            if self.cache is not None:
+                # Templating rewrites the source doc and then reverts it, and
+                # the rendered copy is only stored after the revert; so a copy
+                # written today and after the doc's last change is current.
+                source_modified = self.gdrive_client.get_modified_time(cover_file_id)
+                newer_than = max(source_modified, now.floor("day").datetime)
+                cached = self.cache.get(rendered_key, newer_than=newer_than)
+                if cached:
+                    click.echo(f"Using cached cover {cover_file_id} for {cover_date}.")
+                    return cached
+
+            today, next_tuesday = _formatted_cover_dates(cover_date)
             replacement_map = {
-                "{{DATE}}": today.format("Do MMMM YYYY"),
-                "{{NEXT_TUESDAY}}": _next_tuesday(today).format("Do MMMM YYYY"),
+                "{{DATE}}": today,
+                "{{NEXT_TUESDAY}}": next_tuesday,
             }
             counts = self._apply_template_replacements(cover_file_id, replacement_map)
 
             try:
+                # Templating has just modified the doc, so the export cache
+                # can't hit; skip its modified-time lookup.
                 pdf_data = self.gdrive_client.download_file(
                     file_id=cover_file_id,
                     file_name=f"Cover-{cover_file_id}",
                     cache_prefix="covers",
                     mime_type="application/pdf",
                     export=True,
+                    use_cache=False,
                 )
-                return fitz.open(stream=pdf_data, filetype="pdf")
-            except fitz.EmptyFileError as e:
-                raise CoverGenerationException(
-                    "Downloaded cover file is corrupted. Please check the file on Google Drive."
-                ) from e
             finally:
                 # Revert only the placeholders that were actually present. On a
                 # Tuesday {{DATE}} and {{NEXT_TUESDAY}} format to the same string,
@@ -121,20 +170,35 @@ class CoverGenerator:
                 revert_map = {
                     replacement_map[p]: p
                     for p in replacement_map
-                    if counts.get(p, 0) > 0
+                    if counts and counts.get(p, 0) > 0
                 }
                 if revert_map:
                     self._apply_template_replacements(cover_file_id, revert_map)
+
+            # An untemplated export still shows the raw placeholders; don't
+            # keep serving it for the rest of the day once the error clears.
+            if self.cache is not None and counts is not None:
+                self.cache.put(rendered_key, pdf_data)
+            return pdf_data
         else:
             # No templating, just download the file
-            pdf_data = self.gdrive_client.download_file(
+            return self.gdrive_client.download_file(
                 file_id=cover_file_id,
                 file_name=f"Cover-{cover_file_id}",
                 cache_prefix="covers",
                 mime_type="application/pdf",
                 export=False,
             )
-            return fitz.open(stream=pdf_data, filetype="pdf")
+
+
+def open_cover_pdf(pdf_data: bytes) -> fitz.Document:
+    """Open downloaded cover PDF bytes."""
+    try:
+        return fitz.open(stream=pdf_data, filetype="pdf")
+    except fitz.EmptyFileError as e:
+        raise CoverGenerationException(
+            "Downloaded cover file is corrupted. Please check the file on Google Drive."
+        ) from e
 
 
 def generate_cover(cache, cover_file_id=None):
@@ -147,5 +211,5 @@ def generate_cover(cache, cover_file_id=None):
     docs_write = build("docs", "v1", credentials=creds)
     gdrive_client = GoogleDriveClient(cache=cache, credentials=creds)
     cover_config = config.get_settings().cover
-    generator = CoverGenerator(gdrive_client, docs_write, cover_config)
+    generator = CoverGenerator(gdrive_client, docs_write, cover_config, cache=cache)
     return generator.generate_cover(cover_file_id)
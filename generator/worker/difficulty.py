@@ -1,9 +1,24 @@
+import re
 from typing import List
 
 import numpy as np
 
 from .models import File
 
+# Matches the decimal numbers stored in the 'difficulty' property (e.g. "3",
+# "2.5", " .5 ", "2e0"). Anything else, including "inf" and "nan", which
+# would break the normalization, is treated as missing.
+_NUMERIC_RE = re.compile(r"\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+
+def _parse_difficulty(value) -> float:
+    """Return `value` as a float, or -1 if it is missing or not numeric."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _NUMERIC_RE.fullmatch(value):
+        return float(value)
+    return -1.0
+
 
 def assign_difficulty_bins(files: List[File], num_bins: int = 5) -> None:
     """
@@ -24,14 +39,11 @@ def assign_difficulty_bins(files: List[File], num_bins: int = 5) -> None:
     if not files:
         return
 
-    raw_difficulties = []
-    for f in files:
-        try:
-            raw_difficulties.append(float(f.properties.get("difficulty", -1)))
-        except (ValueError, TypeError):
-            raw_difficulties.append(-1)
-
-    diffs = np.array(raw_difficulties)
+    diffs = np.fromiter(
+        (_parse_difficulty(f.properties.get("difficulty")) for f in files),
+        dtype=np.float64,
+        count=len(files),
+    )
     valid_mask = diffs != -1
 
     if not np.any(valid_mask):
@@ -39,28 +51,32 @@ def assign_difficulty_bins(files: List[File], num_bins: int = 5) -> None:
             file.properties["difficulty_bin"] = "0"
         return
 
-    min_diff = diffs[valid_mask].min()
+    # Reduce over the valid entries in place rather than copying them out.
+    min_diff = diffs.min(where=valid_mask, initial=np.inf)
+    if diffs.max(where=valid_mask, initial=-np.inf) == min_diff:
+        # Every valid difficulty normalizes to 0, i.e. the lowest bin.
+        for file, is_valid in zip(files, valid_mask):
+            file.properties["difficulty_bin"] = "1" if is_valid else "0"
+        return
+
     # The original script used a hardcoded max of 5.
     scaler = 5.0 - min_diff
     if scaler <= 0:
         scaler = 1.0  # Avoid division by zero if all difficulties are >= 5
 
-    # Normalize valid difficulties to a 0-1 range
-    diffs[valid_mask] = (diffs[valid_mask] - min_diff) / scaler
-
-    # Digitize into bins. Bins are 1-based, e.g., for num_bins=5, [1, 2, 3, 4, 5]
-    bins = np.linspace(0, 1, num_bins + 1)
-    digitized = np.digitize(diffs[valid_mask], bins=bins, right=True)
+    # Normalize valid difficulties to a 0-1 range, in place
+    np.subtract(diffs, min_diff, out=diffs, where=valid_mask)
+    np.divide(diffs, scaler, out=diffs, where=valid_mask)
 
-    # Clamp values to be within [1, num_bins]
-    digitized[digitized == 0] = 1
-    digitized[digitized > num_bins] = num_bins
-    diffs[valid_mask] = digitized
+    # Bins are 1-based, e.g., for num_bins=5, [1, 2, 3, 4, 5]. Searching the
+    # inner bin edges is equivalent to np.digitize(right=True) followed by
+    # clamping to [1, num_bins], without the intermediate masked copies.
+    inner_edges = np.linspace(0, 1, num_bins + 1)[1:-1]
+    bin_indices = np.searchsorted(inner_edges, diffs, side="left")
+    bin_indices += 1
+    # Files with invalid/missing difficulty go in bin 0.
+    bin_indices[~valid_mask] = 0
 
     # Assign the calculated bin back to the file properties
-    for i, file in enumerate(files):
-        bin_index = int(diffs[i])
-        # Files with invalid/missing difficulty are marked as -1, should be bin 0.
-        if bin_index == -1:
-            bin_index = 0
+    for file, bin_index in zip(files, bin_indices.tolist()):
         file.properties["difficulty_bin"] = str(bin_index)
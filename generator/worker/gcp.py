@@ -1,4 +1,5 @@
-from typing import List, Optional
+import functools
+from typing import List, Optional, Tuple
 from google.auth import default, credentials, impersonated_credentials
 
 
@@ -8,6 +9,11 @@ def get_credentials(
     """
     Get Google API credentials for given scopes, with optional impersonation.
 
+    Credentials are cached per (scopes, target principal) for the lifetime of
+    the process, so repeated builds skip the Application Default Credentials
+    lookup (which may hit the metadata server). The returned objects refresh
+    their tokens on their own when they expire.
+
     Args:
         scopes: List of OAuth2 scopes to request.
         target_principal: The service account to impersonate.
@@ -15,13 +21,20 @@ def get_credentials(
     Returns:
         A Google credentials object.
     """
-    creds, _ = default(scopes=scopes)
+    return _cached_credentials(tuple(sorted(scopes)), target_principal)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_credentials(
+    scopes: Tuple[str, ...], target_principal: Optional[str]
+) -> credentials.Credentials:
+    creds, _ = default(scopes=list(scopes))
 
     if target_principal:
         creds = impersonated_credentials.Credentials(
             source_credentials=creds,
             target_principal=target_principal,
-            target_scopes=scopes,
+            target_scopes=list(scopes),
         )
 
     return creds
@@ -1,11 +1,19 @@
+import contextlib
+import functools
 import os
 import json
 import base64
 import tempfile
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from google.api_core.exceptions import GoogleAPICallError
 from google.cloud import firestore, storage
+from google.cloud.storage import transfer_manager
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from loguru import logger
 from opentelemetry import trace
 from ..common.filters import parse_filters
@@ -23,16 +31,10 @@ from ..common.gdrive import GoogleDriveClient
 # Initialize tracing
 from ..common.tracing import get_tracer, setup_tracing
 
-# Cache for initialized clients to avoid re-initialization on warm starts
-_services = None
-
 
+@functools.lru_cache(maxsize=1)
 def _get_services():
     """Initializes and returns services, using a cache for warm starts."""
-    global _services
-    if _services is not None:
-        return _services
-
     project_id = os.environ["GOOGLE_CLOUD_PROJECT"]
     service_name = os.environ.get("K_SERVICE", "songbook-generator-worker")
     os.environ["GCP_PROJECT_ID"] = project_id
@@ -45,34 +47,208 @@ def _get_services():
     storage_client = storage.Client(project=project_id)
     cdn_bucket = storage_client.bucket(gcs_cdn_bucket_name)
 
-    _services = {
+    return {
         "tracer": tracer,
         "db": db,
         "cdn_bucket": cdn_bucket,
         "firestore_collection": firestore_collection,
         "gcs_cdn_bucket_name": gcs_cdn_bucket_name,
     }
-    return _services
 
 
-def make_progress_callback(job_ref):
-    """Return a callback that writes progress info into Firestore."""
+@functools.cache
+def _get_drive_and_cache():
+    """
+    Return the Drive client and song cache, built once per container.
 
-    def _callback(percent: float, message: str = None):
-        update = {
+    Kept separate from :func:`_get_services` and resolved inside the job's
+    error handling, so that a misconfiguration is reported on the job as
+    FAILED instead of preventing the worker from starting.
+    """
+    return init_services()  # Uses ADC from env
+
+
+def _warm_up():
+    """
+    Build the cached services and prime the Firestore channel.
+
+    Called at import time on the worker deployment, i.e. during container
+    start-up, so the first job does not pay for client construction and the
+    gRPC/TLS/auth handshake.
+    """
+    services = _get_services()
+    try:
+        services["db"].collection(services["firestore_collection"]).document(
+            "_warmup"
+        ).get()
+    except GoogleAPICallError as e:
+        logger.warning(f"Firestore warm-up read failed: {e}")
+
+
+# Songbooks larger than the client's multipart limit (8 MiB) go through a
+# resumable upload. An explicit chunk size (a multiple of 256 KiB) streams
+# the file from disk in pieces, so a transient error only retries the
+# current chunk instead of the default 100 MiB one.
+PDF_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+# Above this size the PDF is split into parts that are uploaded in parallel
+# and assembled server-side, instead of going through one connection.
+PARALLEL_UPLOAD_THRESHOLD_BYTES = 32 * 1024 * 1024
+PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+PARALLEL_UPLOAD_MAX_WORKERS = 8
+
+
+def _upload_pdf(blob, path: str, size_bytes: int):
+    """Upload the songbook PDF, using parallel parts when it is large."""
+    if size_bytes > PARALLEL_UPLOAD_THRESHOLD_BYTES:
+        # Threads rather than processes: the work is network-bound and the
+        # worker only has a single vCPU.
+        transfer_manager.upload_chunks_concurrently(
+            path,
+            blob,
+            content_type="application/pdf",
+            chunk_size=PARALLEL_UPLOAD_CHUNK_SIZE,
+            worker_type=transfer_manager.THREAD,
+            max_workers=PARALLEL_UPLOAD_MAX_WORKERS,
+        )
+    else:
+        blob.upload_from_filename(path, content_type="application/pdf")
+
+
+# Minimum time between two progress writes to Firestore. Ticks arriving
+# faster than this are coalesced and only the most recent one is written.
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+# Upper bound on the FAILED status write, so that a struggling Firestore
+# doesn't hold up re-raising the error that failed the job.
+FAILED_STATUS_TIMEOUT_SECONDS = 10.0
+
+# A RUNNING job that was started less than this long ago is assumed to still
+# be in progress elsewhere. Longer than the worker's maximum run time (the
+# 540s function timeout set in .github/workflows/deploy.yaml), so an older
+# RUNNING job is one whose attempt crashed or timed out, and a later delivery
+# of it is processed.
+JOB_CLAIM_LEASE_SECONDS = 10 * 60
+
+
+def _claim_job(transaction, job_ref) -> Optional[str]:
+    """
+    Mark the job RUNNING, unless another attempt has it or it is done.
+
+    Pub/Sub delivers at least once, so the same job can arrive again after it
+    has completed (e.g. if the ack was lost) or while it is still being built.
+    Run through ``firestore.transactional`` so that reading and claiming
+    happen in one transaction, and only one of two concurrent deliveries gets
+    to build the songbook.
+
+    Returns None if the job was claimed, or else the status that it was
+    skipped for.
+    """
+    snapshot = job_ref.get(transaction=transaction)
+    job = (snapshot.to_dict() or {}) if snapshot.exists else {}
+    status = job.get("status")
+    if status == "COMPLETED":
+        return status
+    if status == "RUNNING":
+        started_at = job.get("started_at")
+        lease = timedelta(seconds=JOB_CLAIM_LEASE_SECONDS)
+        if started_at is not None and datetime.now(timezone.utc) - started_at < lease:
+            return status
+
+    transaction.update(
+        job_ref, {"status": "RUNNING", "started_at": firestore.SERVER_TIMESTAMP}
+    )
+    return None
+
+
+class _ProgressWriter:
+    """
+    Progress callback that writes to Firestore from a background thread.
+
+    Generation never waits on Firestore: each tick replaces the pending one
+    and a daemon thread writes the latest at most once per ``min_interval``.
+    ``close()`` flushes the last tick and stops the thread, and must be called
+    before the job's terminal status is written so that a late progress
+    update cannot flip it back to RUNNING.
+    """
+
+    def __init__(self, job_ref, min_interval: float):
+        self._job_ref = job_ref
+        self._min_interval = min_interval
+        # Fields that are the same on every progress write.
+        self._update_template = {
             "status": "RUNNING",
+            "updated_at": firestore.SERVER_TIMESTAMP,
+        }
+        self._pending = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="progress-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, percent: float, message: str = None):
+        with self._cond:
+            self._pending = (percent, message)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                percent, message = self._pending
+                self._pending = None
+            self._write(percent, message)
+            deadline = time.monotonic() + self._min_interval
+            with self._cond:
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+    def _write(self, percent: float, message: str):
+        update = {
+            **self._update_template,
             "progress": percent,
             "last_message": message or "",
-            "updated_at": firestore.SERVER_TIMESTAMP,
         }
-        job_ref.update(update)
+        try:
+            self._job_ref.update(update)
+        except GoogleAPICallError as e:
+            # Progress is informational; the terminal status write still runs.
+            logger.warning(f"Failed to write job progress: {e}")
 
-    return _callback
+
+def make_progress_callback(job_ref, min_interval=PROGRESS_MIN_INTERVAL_SECONDS):
+    """
+    Return a callback that writes progress info into Firestore.
+
+    The callback is a :class:`_ProgressWriter`; call its ``close()`` once
+    generation has finished.
+    """
+    return _ProgressWriter(job_ref, min_interval)
 
 
 def worker_main(cloud_event):
     services = _get_services()
-    with services["tracer"].start_as_current_span("worker_main") as main_span:
+    tracer = services["tracer"]
+    db = services["db"]
+    firestore_collection = services["firestore_collection"]
+    cdn_bucket = services["cdn_bucket"]
+    gcs_cdn_bucket_name = services["gcs_cdn_bucket_name"]
+    with tracer.start_as_current_span("worker_main") as main_span:
         # 1) Decode Pub/Sub message
         logger.info(f"Received Cloud Event with data: {cloud_event.data}")
         envelope = cloud_event.data
@@ -82,8 +258,10 @@ def worker_main(cloud_event):
         logger.info("Extracting Pub/Sub message from envelope")
         msg = envelope["message"]
 
-        data_payload = base64.b64decode(msg["data"]).decode("utf-8")
+        data_payload = base64.b64decode(msg["data"])
         logger.info("Decoding and parsing Pub/Sub message payload")
+        # json.loads detects the UTF-8 encoding of bytes itself, so there is
+        # no need for an intermediate str.
         evt = json.loads(data_payload)
 
         logger.info(f"Received event: {evt}")
@@ -91,24 +269,36 @@ def worker_main(cloud_event):
         params = evt["params"]
 
         main_span.set_attribute("job_id", job_id)
-        main_span.set_attribute("params_size", len(json.dumps(params)))
-
-        job_ref = (
-            services["db"].collection(services["firestore_collection"]).document(job_id)
+        # Measured on the raw payload (params plus the small job envelope) so
+        # that params don't have to be serialized again just to be sized.
+        main_span.set_attribute("params_size", len(data_payload))
+
+        job_ref = db.collection(firestore_collection).document(job_id)
+
+        # 2) Claim the job by marking it RUNNING, so that a redelivered
+        # message doesn't build and upload the songbook a second time. Status
+        # writes are single RPCs, so they are recorded on the main span
+        # rather than getting spans of their own.
+        logger.info(f"Marking job {job_id} as RUNNING in Firestore")
+        skipped_status = firestore.transactional(_claim_job)(
+            db.transaction(), job_ref
         )
-
-        # 2) Mark RUNNING
-        with services["tracer"].start_as_current_span(
-            "update_job_status"
-        ) as status_span:
-            logger.info(f"Marking job {job_id} as RUNNING in Firestore")
-            job_ref.update(
-                {"status": "RUNNING", "started_at": firestore.SERVER_TIMESTAMP}
-            )
-            status_span.set_attribute("status", "RUNNING")
-
+        if skipped_status is not None:
+            # The message is acked either way. The worker is deployed without
+            # --retry, so nothing redelivers it later: if the attempt holding
+            # the lease crashes before marking the job FAILED, the job stays
+            # RUNNING until it is requested again.
+            logger.info(f"Job {job_id} is already {skipped_status}, skipping")
+            main_span.set_attribute("status", skipped_status)
+            main_span.set_attribute("redelivered", True)
+            return
+        main_span.set_attribute("status", "RUNNING")
+
+        # Temp file path, removed on every exit path
+        out_path_str = None
+        progress_callback = None
         try:
-            drive, cache = init_services()  # Uses ADC from env
+            drive, cache = _get_drive_and_cache()
             settings = get_settings()
             source_folders = (
                 params.get("source_folders") or settings.song_sheets.folder_ids
@@ -126,17 +316,12 @@ def worker_main(cloud_event):
             if postface_file_ids:
                 main_span.set_attribute("postface_files_count", len(postface_file_ids))
 
-            # Initialize temp file paths for cleanup
-            out_path_str = None
-            manifest_path_str = None
-
             # 3) Generate into a temp file
             generation_start_time = datetime.now(timezone.utc)
             selected_edition = None
-            with services["tracer"].start_as_current_span(
-                "generate_songbook"
-            ) as gen_span:
-                out_path_str = tempfile.mktemp(suffix=".pdf")
+            with tracer.start_as_current_span("generate_songbook") as gen_span:
+                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                    out_path_str = tmp.name
                 out_path = Path(out_path_str)
                 logger.info(
                     f"Generating songbook for job {job_id} with parameters: {params}"
@@ -246,6 +431,7 @@ def worker_main(cloud_event):
                         postface_file_ids=postface_file_ids,
                         on_progress=progress_callback,
                     )
+                progress_callback.close()
                 gen_span.set_attribute("output_path", str(out_path))
                 generation_end_time = datetime.now(timezone.utc)
                 generation_duration_seconds = (
@@ -287,9 +473,7 @@ def worker_main(cloud_event):
                 )
 
             # 3.5) Generate manifest.json
-            with services["tracer"].start_as_current_span(
-                "generate_manifest"
-            ) as manifest_span:
+            with tracer.start_as_current_span("generate_manifest") as manifest_span:
                 logger.info(f"Generating manifest for job {job_id}")
                 manifest_data = generate_manifest(
                     job_id=job_id,
@@ -305,64 +489,61 @@ def worker_main(cloud_event):
                     page_indices=generation_info.get("page_indices"),
                 )
 
-                # Save manifest to temporary file for upload
-                manifest_path_str = tempfile.mktemp(suffix=".json")
-                manifest_path = Path(manifest_path_str)
-                with open(manifest_path, "w", encoding="utf-8") as f:
-                    json.dump(manifest_data, f, indent=2)
-
-                manifest_span.set_attribute("manifest_path", str(manifest_path))
-                manifest_span.set_attribute(
-                    "manifest_size", os.path.getsize(manifest_path)
-                )
+                # Serialize in memory; the manifest is small enough to upload
+                # straight from a string without a temp file round-trip.
+                manifest_json = json.dumps(manifest_data, indent=2).encode("utf-8")
+                manifest_span.set_attribute("manifest_size", len(manifest_json))
 
             # 4) Upload to GCS
-            with services["tracer"].start_as_current_span(
-                "upload_to_gcs"
-            ) as upload_span:
-                blob = services["cdn_bucket"].blob(f"{job_id}/songbook.pdf")
+            with tracer.start_as_current_span("upload_to_gcs") as upload_span:
+                blob = cdn_bucket.blob(
+                    f"{job_id}/songbook.pdf", chunk_size=PDF_UPLOAD_CHUNK_SIZE
+                )
+                manifest_blob = cdn_bucket.blob(f"{job_id}/manifest.json")
                 pdf_size_bytes = os.path.getsize(out_path_str)
                 logger.info(
-                    f"Uploading generated songbook to GCS bucket: {services['gcs_cdn_bucket_name']} "
-                    f"(size: {pdf_size_bytes} bytes)"
+                    f"Uploading generated songbook and manifest to GCS bucket: "
+                    f"{gcs_cdn_bucket_name} (size: {pdf_size_bytes} bytes)"
                 )
-                blob.upload_from_filename(out_path_str, content_type="application/pdf")
+                # The two uploads are independent and purely I/O bound, so run
+                # them side by side; result() re-raises the first failure.
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    uploads = [
+                        executor.submit(
+                            _upload_pdf, blob, out_path_str, pdf_size_bytes
+                        ),
+                        executor.submit(
+                            manifest_blob.upload_from_string,
+                            manifest_json,
+                            content_type="application/json",
+                        ),
+                    ]
+                    for upload in uploads:
+                        upload.result()
                 result_url = blob.public_url  # or use signed URL if you need auth
-                upload_span.set_attribute("gcs_bucket", services["gcs_cdn_bucket_name"])
+                manifest_url = manifest_blob.public_url
+                upload_span.set_attribute("gcs_bucket", gcs_cdn_bucket_name)
                 upload_span.set_attribute("blob_name", f"{job_id}/songbook.pdf")
                 upload_span.set_attribute("pdf_size_bytes", pdf_size_bytes)
-
-                # Upload manifest.json alongside the PDF
-                manifest_blob = services["cdn_bucket"].blob(f"{job_id}/manifest.json")
-                logger.info(
-                    f"Uploading generation manifest to GCS bucket: {services['gcs_cdn_bucket_name']}"
-                )
-                manifest_blob.upload_from_filename(
-                    manifest_path_str, content_type="application/json"
-                )
-                manifest_url = manifest_blob.public_url
                 upload_span.set_attribute(
                     "manifest_blob_name", f"{job_id}/manifest.json"
                 )
                 upload_span.set_attribute("manifest_url", manifest_url)
 
             # 5) Update Firestore to COMPLETED
-            with services["tracer"].start_as_current_span(
-                "complete_job"
-            ) as complete_span:
-                logger.info(
-                    f"Marking job {job_id} as COMPLETED in Firestore with result URL: {result_url}"
-                )
-                job_ref.update(
-                    {
-                        "status": "COMPLETED",
-                        "completed_at": firestore.SERVER_TIMESTAMP,
-                        "result_url": result_url,
-                        "manifest_url": manifest_url,
-                    }
-                )
-                complete_span.set_attribute("status", "COMPLETED")
-                complete_span.set_attribute("result_url", result_url)
+            logger.info(
+                f"Marking job {job_id} as COMPLETED in Firestore with result URL: {result_url}"
+            )
+            job_ref.update(
+                {
+                    "status": "COMPLETED",
+                    "completed_at": firestore.SERVER_TIMESTAMP,
+                    "result_url": result_url,
+                    "manifest_url": manifest_url,
+                }
+            )
+            main_span.set_attribute("status", "COMPLETED")
+            main_span.set_attribute("result_url", result_url)
 
         except Exception as exc:  # noqa: BLE001 - Top level error handler
             # on any failure, mark FAILED
@@ -377,13 +558,32 @@ def worker_main(cloud_event):
             main_span.set_status(trace.StatusCode.ERROR, error_message)
             main_span.record_exception(exc)
 
-            job_ref.update(
-                {
-                    "status": "FAILED",
-                    "completed_at": firestore.SERVER_TIMESTAMP,
-                    "error": f"{error_type}: {error_message}",
-                }
-            )
+            if progress_callback is not None:
+                progress_callback.close()
+            try:
+                job_ref.update(
+                    {
+                        "status": "FAILED",
+                        "completed_at": firestore.SERVER_TIMESTAMP,
+                        "error": f"{error_type}: {error_message}",
+                    },
+                    timeout=FAILED_STATUS_TIMEOUT_SECONDS,
+                )
+            except GoogleAPICallError as e:
+                # Don't let the status write mask the original error.
+                logger.warning(f"Failed to mark job {job_id} as FAILED: {e}")
             logger.error(f"Job {job_id} failed with {error_type}: {error_message}")
             logger.error(f"{exc_info}")
             raise
+        finally:
+            # /tmp is in-memory on Cloud Run, so leftovers eat into the
+            # instance's RAM across jobs.
+            if out_path_str is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(out_path_str)
+
+
+# Cloud Functions sets FUNCTION_TARGET to the entry point being served; only
+# the worker deployment has the environment needed to build these services.
+if os.environ.get("FUNCTION_TARGET") == "worker":
+    _warm_up()
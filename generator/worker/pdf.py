@@ -1,18 +1,22 @@
+import contextlib
+import contextvars
+import functools
 import fitz
 import click
 import json
 import os
+import re
 import yaml
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from opentelemetry import trace
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Tuple, Union, Dict, Any
 from pydantic import ValidationError
 from . import progress
 from . import toc
 from . import badges as badges_mod
 from . import cover
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from ..common import caching, config
 from ..common.config import CoverSection, PrefaceSection, PostfaceSection
@@ -22,14 +26,13 @@ from .exceptions import PdfCopyException, PdfCacheNotFound, PdfCacheMissExceptio
 from ..common.filters import PropertyFilter, FilterGroup
 from ..common.gdrive import (
     GoogleDriveClient,
+    build_service,
     client,
 )
 from ..common.song_source import SongSheetSource
 from .models import File
 from ..common.tracing import get_tracer
-from natsort import natsorted
 from unidecode import unidecode
-import re
 
 tracer = get_tracer(__name__)
 
@@ -57,7 +60,8 @@ def init_services(
         # Then check for user credentials
         elif hasattr(creds, "token"):
             auth_type = "User Credentials"
-            try:
+            # Ignore errors fetching user info
+            with contextlib.suppress(HttpError):
                 about = drive.about().get(fields="user").execute()
                 user_info = about.get("user")
                 if user_info:
@@ -66,22 +70,51 @@ def init_services(
                     main_span.set_attribute("auth.type", auth_type)
                     main_span.set_attribute("auth.email", email)
                     main_span.set_attribute("auth.user", user_name)
-            except HttpError:
-                pass  # Ignore errors fetching user info
         main_span.set_attribute("auth.scopes", str(creds.scopes))
         return drive, cache
 
 
-def _create_song_sort_key(file_obj: File) -> str:
-    name = file_obj.name
+# Deletes every ASCII character that isn't a letter or digit. Sort keys are
+# ASCII by this point (unidecode only emits ASCII), so this matches stripping
+# r"[\W_]+" without going through the regex engine.
+_SORT_KEY_STRIP_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not c.isalnum())
+)
+
+
+def _normalize_song_title(name: str) -> str:
     title = name.split(" - ")[0] if " - " in name else name
-    title_no_accents = unidecode(title)
-    title_no_punctuation = re.sub(r"[\W_]+", "", title_no_accents)
+    # Most titles are plain ASCII and have nothing to transliterate.
+    title_no_accents = title if title.isascii() else unidecode(title)
+    title_no_punctuation = title_no_accents.translate(_SORT_KEY_STRIP_TABLE)
     return title_no_punctuation.lower()
 
 
+_DIGIT_RUN_RE = re.compile(r"(\d+)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _title_sort_key(name: str) -> tuple:
+    """Natural-sort key for a song name, so that e.g. "song2" sorts before "song10".
+
+    The normalized title is split into text and number runs. Splitting on a
+    captured group alternates text and digit runs, starting with text
+    (possibly empty), so keys always compare str with str and int with int.
+    This orders titles as natsort's default algorithm does.
+
+    Cached by name, since a warm worker sorts the same song names on every
+    build.
+    """
+    parts = _DIGIT_RUN_RE.split(_normalize_song_title(name))
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+
+def _song_sort_key(file_obj: File) -> tuple:
+    return _title_sort_key(file_obj.name)
+
+
 def _sort_titles(files: List[File]) -> List[File]:
-    return natsorted(files, key=_create_song_sort_key)
+    return sorted(files, key=_song_sort_key)
 
 
 def _make_song_source(drive, cache) -> SongSheetSource:
@@ -190,6 +223,27 @@ def categorize_folder_files(files: List[File]) -> Dict[str, Any]:
     }
 
 
+MERGED_PDF_CACHE_KEY = "merged-pdf/latest.pdf"
+
+# Song titles usually sit at the top of the first page of a sheet. Searching
+# this band first avoids extracting the text of the whole page to locate them.
+TITLE_SEARCH_HEIGHT_FRACTION = 0.25
+
+
+def _find_song_title(page, title: str) -> list:
+    """
+    Return the rects where *title* appears on *page*.
+
+    The top of the page is searched first; the whole page is only searched
+    when the title is not found there.
+    """
+    rect = page.rect
+    clip = fitz.Rect(
+        rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * TITLE_SEARCH_HEIGHT_FRACTION
+    )
+    return page.search_for(title, clip=clip) or page.search_for(title)
+
+
 def copy_pdfs(
     destination_pdf,
     files: List[File],
@@ -200,6 +254,7 @@ def copy_pdfs(
     toc_page_index: int = 0,
     add_difficulty_wheels=True,
     decorations=None,
+    cached_pdf_data: Optional[bytes] = None,
 ):
     """
     Copy pages from the merged PDF cache based on TOC entries for the selected files.
@@ -213,26 +268,40 @@ def copy_pdfs(
         add_page_numbers: Whether to add page numbers
         decorations: Optional TOC decorations; matching pride/identity flags are
             stamped after each song's title on its first page.
+        cached_pdf_data: The merged PDF, if it was already fetched from the
+            cache (see :func:`_prefetch_merged_pdf`).
     """
     with tracer.start_as_current_span("copy_pdfs") as span:
         files_count = len(files)
         span.set_attribute("files_count", files_count)
         span.set_attribute("add_page_numbers", add_page_numbers)
 
-        # Try to get the cached merged PDF
-        cached_pdf_data = cache.get("merged-pdf/latest.pdf")
-        if not cached_pdf_data:
-            span.set_attribute("cache_miss", True)
-            raise PdfCacheNotFound("Cached merged PDF not found")
+        # Open the cached merged PDF in place when the cache is on local disk;
+        # MuPDF then reads pages from the file as needed instead of us loading
+        # the whole (large) merged PDF into memory first.
+        cached_pdf_path = (
+            None if cached_pdf_data else cache.local_path(MERGED_PDF_CACHE_KEY)
+        )
+        if cached_pdf_path:
+            span.set_attribute("cache_hit", True)
+            span.set_attribute("cached_pdf_size", os.path.getsize(cached_pdf_path))
+            cached_pdf = fitz.open(cached_pdf_path, filetype="pdf")
+        else:
+            if cached_pdf_data is None:
+                cached_pdf_data = cache.get(MERGED_PDF_CACHE_KEY)
+            if not cached_pdf_data:
+                span.set_attribute("cache_miss", True)
+                raise PdfCacheNotFound("Cached merged PDF not found")
 
-        span.set_attribute("cache_hit", True)
-        span.set_attribute("cached_pdf_size", len(cached_pdf_data))
+            span.set_attribute("cache_hit", True)
+            span.set_attribute("cached_pdf_size", len(cached_pdf_data))
+            cached_pdf = fitz.open(stream=cached_pdf_data)
 
-        # Open the cached merged PDF
-        with fitz.open(stream=cached_pdf_data) as cached_pdf:
+        with cached_pdf:
             cached_toc = cached_pdf.get_toc()
+            cached_page_count = len(cached_pdf)
             span.set_attribute("cached_toc_entries", len(cached_toc))
-            span.set_attribute("cached_pdf_page_count", len(cached_pdf))
+            span.set_attribute("cached_pdf_page_count", cached_page_count)
 
             if not cached_toc:
                 span.set_attribute("no_toc", True)
@@ -243,10 +312,18 @@ def copy_pdfs(
             # so we key by ID rather than name — same-named files with different IDs
             # (e.g. custom versions in a drive-edition Songs/ folder) correctly miss
             # the cache and fall through to individual downloads.
+            # Each entry maps to the song's (first page, next song's first page)
+            # so the page range is known without rescanning the TOC per file.
             toc_map = {}
-            for level, title, page_num in cached_toc:
-                # Page numbers in TOC are 1-based, convert to 0-based
-                toc_map[title] = page_num - 1
+            for i, (level, title, page_num) in enumerate(cached_toc):
+                # Page numbers in TOC are 1-based, convert to 0-based.
+                # The last song runs to the end of the document.
+                next_page = (
+                    cached_toc[i + 1][2] - 1
+                    if i + 1 < len(cached_toc)
+                    else cached_page_count
+                )
+                toc_map[title] = (page_num - 1, next_page)
 
             # Check upfront which requested files are missing from the cache TOC.
             # Raise before the loop so that no pages are inserted into the destination
@@ -273,78 +350,61 @@ def copy_pdfs(
             copied_pages = 0
 
             for file_number, file in enumerate(files):
-                source_page = toc_map[file.id]
-
-                # Determine how many pages this song has
-                # Find the next song's page or use the last page
-                next_page = len(cached_pdf)  # Default to end of document
-                current_toc_index = None
-
-                # Find current song in TOC to determine page range
-                for i, (level, title, page_num) in enumerate(cached_toc):
-                    if title == file.id:
-                        current_toc_index = i
-                        break
-
-                if current_toc_index is not None and current_toc_index + 1 < len(
-                    cached_toc
-                ):
-                    # Get the page number of the next song (convert from 1-based to 0-based)
-                    next_page = cached_toc[current_toc_index + 1][2] - 1
-
+                source_page, next_page = toc_map[file.id]
                 page_count = next_page - source_page
+                if page_count <= 0:
+                    # An empty sheet in the cache has no pages to copy.
+                    progress_step.increment(
+                        1, f"Copied song sheet {file_number}/{files_count}..."
+                    )
+                    continue
+
+                # Copy the song's whole page range in one call. Links and
+                # annotations are left behind, as page numbers, wheels and the
+                # TOC link are added fresh below. Keeping the graft map
+                # (final=False) means resources shared across songs, such as
+                # fonts, are only copied once.
+                destination_pdf.insert_pdf(
+                    cached_pdf,
+                    from_page=source_page,
+                    to_page=next_page - 1,
+                    links=False,
+                    annots=False,
+                    widgets=False,
+                    final=False,
+                )
+                dest_page = destination_pdf[len(destination_pdf) - page_count]
+
+                # Add page number if requested, on the first page of the song
+                if add_page_numbers:
+                    add_page_number(dest_page, current_page + 1)
+
+                # Add difficulty wheel if requested, on the first page of the song
+                if add_difficulty_wheels:
+                    add_difficulty_wheel(dest_page, file)
+
+                # Search for the full filename as the song title on its first page
+                text_instances = _find_song_title(dest_page, file.name)
+
+                if text_instances:
+                    # Add a link from the first occurrence of the title to the TOC
+                    dest_page.insert_link(
+                        {
+                            "kind": fitz.LINK_GOTO,
+                            "from": text_instances[0],
+                            "page": toc_page_index,
+                        }
+                    )
 
-                # Copy the pages for this song
-                for page_offset_in_song in range(page_count):
-                    source_page_num = source_page + page_offset_in_song
-                    if source_page_num < len(cached_pdf):
-                        page = cached_pdf[source_page_num]
-
-                        # Create new page in destination
-                        dest_page = destination_pdf.new_page(
-                            width=page.rect.width, height=page.rect.height
-                        )
-                        dest_page.show_pdf_page(
-                            dest_page.rect, cached_pdf, source_page_num
-                        )
-
-                        # Add page number if requested and it's the first page of the song
-                        if add_page_numbers and page_offset_in_song == 0:
-                            add_page_number(dest_page, current_page + 1)
-
-                        # Add difficulty wheel if requested and it's the first page of the song
-                        if add_difficulty_wheels and page_offset_in_song == 0:
-                            add_difficulty_wheel(dest_page, file)
-
-                        # On the first page of the song, add a link from the title to the TOC
-                        if page_offset_in_song == 0:
-                            # Use the full filename as the song title for searching
-                            song_title = file.name
-
-                            # Search for the title on the page
-                            text_instances = dest_page.search_for(song_title)
-
-                            if text_instances:
-                                # Add a link over the first occurrence of the title
-                                link_rect = text_instances[0]
-                                dest_page.insert_link(
-                                    {
-                                        "kind": fitz.LINK_GOTO,
-                                        "from": link_rect,
-                                        "page": toc_page_index,
-                                    }
-                                )
-
-                            # Stamp pride/identity flags as a suffix after the title.
-                            add_pride_flags(
-                                dest_page,
-                                file,
-                                decorations,
-                                text_instances[0] if text_instances else None,
-                            )
-
-                        copied_pages += 1
+                # Stamp pride/identity flags as a suffix after the title.
+                add_pride_flags(
+                    dest_page,
+                    file,
+                    decorations,
+                    text_instances[0] if text_instances else None,
+                )
 
+                copied_pages += page_count
                 current_page += page_count
                 progress_step.increment(
                     1, f"Copied song sheet {file_number}/{files_count}..."
@@ -414,7 +474,7 @@ def _download_songs_individually(
                                 add_page_number(dest_page, current_page + 1)
                             if add_difficulty_wheels:
                                 add_difficulty_wheel(dest_page, file)
-                            text_instances = dest_page.search_for(file.name)
+                            text_instances = _find_song_title(dest_page, file.name)
                             if text_instances:
                                 dest_page.insert_link(
                                     {
@@ -789,6 +849,146 @@ def generate_songbook_from_edition(
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _cover_services(cover_creds) -> Tuple[Any, Any]:
+    """Docs and Drive clients for the cover credentials, built once per process.
+
+    Building a client parses its (large) discovery document, and the cover
+    credentials are themselves cached, so the clients can be reused across
+    builds. They are safe to share between threads (see build_service).
+    """
+    return (
+        build_service("docs", "v1", cover_creds),
+        build_service("drive", "v3", cover_creds),
+    )
+
+
+def _fetch_cover(cache, cover_file_id: Optional[str]) -> Optional[bytes]:
+    """Generate the cover using the songbook-generator write credentials.
+
+    Returns the cover PDF bytes, or None if there is no cover.
+    """
+    with tracer.start_as_current_span("generate_cover") as cover_span:
+        cover_span.set_attribute("cover_file_id", cover_file_id or "")
+        cover_span.set_attribute("cover_requested", cover_file_id is not None)
+        settings = config.get_settings()
+        credential_config = settings.google_cloud.credentials.get("songbook-generator")
+        cover_creds = get_credentials(
+            scopes=credential_config.scopes,
+            target_principal=credential_config.principal,
+        )
+        docs_write_service, drive_write_service = _cover_services(cover_creds)
+        gdrive_client_write = GoogleDriveClient(cache=cache, drive=drive_write_service)
+        cover_generator = cover.CoverGenerator(
+            gdrive_client_write,
+            docs_write_service,
+            cover_config=settings.cover,
+            cache=cache,
+        )
+        cover_data = cover_generator.fetch_cover_pdf(cover_file_id)
+        cover_span.set_attribute("cover_generated", cover_data is not None)
+        return cover_data
+
+
+def _prefetch_cover(cache, cover_file_id: Optional[str]) -> Future:
+    """
+    Start :func:`_fetch_cover` on a background thread.
+
+    Only the Docs/Drive round-trips run there; the PDF is opened on the
+    caller's thread since PyMuPDF is not thread-safe. The current context is
+    copied into the thread so that the cover span is still parented to the
+    caller's span. Errors surface from ``Future.result()``.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cover")
+    try:
+        return executor.submit(
+            contextvars.copy_context().run, _fetch_cover, cache, cover_file_id
+        )
+    finally:
+        # Let the worker thread exit once the cover is done.
+        executor.shutdown(wait=False)
+
+
+def _prefetch_merged_pdf(cache) -> Future:
+    """
+    Start downloading the merged PDF from a remote cache on a background thread.
+
+    The future resolves to the PDF's bytes, or ``None`` when there is nothing
+    to prefetch: a local cache is opened in place by :func:`copy_pdfs`. Only
+    the download runs in the thread; parsing stays on the caller's thread.
+    """
+    if cache.local_path(MERGED_PDF_CACHE_KEY):
+        future = Future()
+        future.set_result(None)
+        return future
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="merged-pdf")
+    try:
+        return executor.submit(
+            contextvars.copy_context().run, cache.get, MERGED_PDF_CACHE_KEY
+        )
+    finally:
+        executor.shutdown(wait=False)
+
+
+# Upper bound on concurrent preface/postface downloads, to stay clear of
+# Drive's per-user rate limits.
+FRONT_BACK_MATTER_DOWNLOAD_WORKERS = 4
+
+
+def _prefetch_file_streams(
+    gdrive_client: GoogleDriveClient, files: List[File]
+) -> List[Future]:
+    """
+    Start downloading *files* on background threads.
+
+    Returns one future per file, in the same order, each resolving to the
+    file's PDF stream. As for the cover, every download runs in a copy of
+    the current context so that its spans stay parented to the caller's.
+    """
+    if not files:
+        return []
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(files), FRONT_BACK_MATTER_DOWNLOAD_WORKERS),
+        thread_name_prefix="prefetch",
+    )
+    try:
+        return [
+            executor.submit(
+                contextvars.copy_context().run,
+                gdrive_client.download_file_stream,
+                file,
+            )
+            for file in files
+        ]
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _save_songbook_pdf(songbook_pdf: fitz.Document, destination_path: Path) -> None:
+    """
+    Save the assembled songbook.
+
+    Unlike ez_save's garbage=3, only unused objects are dropped: the
+    duplicate-object comparison pass is what makes ez_save slow on a full
+    songbook, and it finds next to nothing to merge, since font and image
+    streams are only compared at garbage=4. deflate=True still compresses any
+    uncompressed stream, images included; deflate_images=False only skips
+    recompressing the song sheet images that are already compressed. The
+    output stays within 1% of ez_save's size (see test_pdf.py).
+    """
+    songbook_pdf.save(
+        destination_path,
+        garbage=1,
+        clean=False,
+        deflate=True,
+        deflate_images=False,
+        deflate_fonts=True,
+        use_objstms=1,
+        no_new_id=True,
+    )
+
+
 def generate_songbook(
     drive,
     cache,
@@ -867,6 +1067,15 @@ def generate_songbook(
                 f"Using {len(files)} pre-supplied song files. Starting generation..."
             )
 
+        # Now that there is a songbook to build, start the network-bound work
+        # it needs later. The cover (templating, export, download) is only
+        # needed once assembly starts, so fetch it while the preface/postface
+        # metadata is retrieved. Likewise the merged PDF the song sheets are
+        # copied from, which can be large: download it while the cover and
+        # TOC are prepared.
+        cover_future = _prefetch_cover(cache, cover_file_id)
+        merged_pdf_future = _prefetch_merged_pdf(cache)
+
         span.set_attribute("final_files_count", len(files))
         span.set_attribute("song_file_names", json.dumps([f.name for f in files]))
         span.set_attribute("song_file_ids", json.dumps([f.id for f in files]))
@@ -899,6 +1108,11 @@ def generate_songbook(
                     )
                     click.echo(f"Found {len(postface_files)} postface files.")
 
+        # Download preface and postface files concurrently, while the TOC and
+        # body are being built; they're consumed in order further down.
+        preface_streams = _prefetch_file_streams(gdrive_client, preface_files)
+        postface_streams = _prefetch_file_streams(gdrive_client, postface_files)
+
         click.echo("Generating songbook PDF...")
 
         # Load environment variable for page numbering
@@ -929,52 +1143,25 @@ def generate_songbook(
 
                 # Generate cover first to know if we need to adjust page offset
                 with reporter.step(1, "Generating cover..."):
-                    with tracer.start_as_current_span("generate_cover") as cover_span:
-                        cover_span.set_attribute("cover_file_id", cover_file_id or "")
-                        cover_span.set_attribute(
-                            "cover_requested", cover_file_id is not None
-                        )
-                        settings = config.get_settings()
-                        credential_config = settings.google_cloud.credentials.get(
-                            "songbook-generator"
-                        )
-                        cover_creds = get_credentials(
-                            scopes=credential_config.scopes,
-                            target_principal=credential_config.principal,
-                        )
-                        docs_write_service = build(
-                            "docs", "v1", credentials=cover_creds
-                        )
-                        drive_write_service = build(
-                            "drive", "v3", credentials=cover_creds
-                        )
-                        gdrive_client_write = GoogleDriveClient(
-                            cache=cache, drive=drive_write_service
-                        )
-                        cover_generator = cover.CoverGenerator(
-                            gdrive_client_write,
-                            docs_write_service,
-                            cover_config=config.get_settings().cover,
-                        )
-                        cover_pdf = cover_generator.generate_cover(cover_file_id)
-                        cover_span.set_attribute(
-                            "cover_generated", cover_pdf is not None
-                        )
-                        if cover_pdf is not None:
-                            cover_span.set_attribute("cover_page_count", len(cover_pdf))
+                    cover_data = cover_future.result()
+                    cover_pdf = (
+                        cover.open_cover_pdf(cover_data)
+                        if cover_data is not None
+                        else None
+                    )
+                    if cover_pdf is not None:
+                        pdf_span.set_attribute("cover_page_count", len(cover_pdf))
 
                 # We need to calculate TOC size first to properly set page offsets
                 with reporter.step(1, "Pre-calculating table of contents..."):
                     with tracer.start_as_current_span(
                         "precalculate_toc"
                     ) as pretoc_span:
-                        toc_pdf, toc_entries = toc.build_table_of_contents(
-                            files, 0, edition_toc_config
-                        )  # Temporary offset
-                        toc_page_count = len(toc_pdf)
+                        # One line per song, so the page count follows from the
+                        # layout without building the TOC twice.
+                        toc_page_count = toc.toc_page_count(files, edition_toc_config)
                         pretoc_span.set_attribute("toc_page_count", toc_page_count)
-                        pretoc_span.set_attribute("toc_entries_count", len(toc_entries))
-                        toc_pdf.close()  # Close temporary TOC
+                        pretoc_span.set_attribute("toc_entries_count", len(files))
 
                 # Calculate page offset based on cover + preface pages + TOC pages
                 cover_page_count = 1 if cover_pdf else 0
@@ -1000,11 +1187,11 @@ def generate_songbook(
                         with tracer.start_as_current_span(
                             "add_preface_files"
                         ) as preface_span:
-                            for file in preface_files:
+                            for file, stream_future in zip(
+                                preface_files, preface_streams
+                            ):
                                 with (
-                                    gdrive_client.download_file_stream(
-                                        file
-                                    ) as pdf_stream,
+                                    stream_future.result() as pdf_stream,
                                     fitz.open(stream=pdf_stream) as pdf_document,
                                 ):
                                     songbook_pdf.insert_pdf(
@@ -1065,6 +1252,7 @@ def generate_songbook(
                                 if edition_toc_config
                                 else None
                             ),
+                            cached_pdf_data=merged_pdf_future.result(),
                         )
                     except PdfCopyException as e:
                         click.echo(
@@ -1087,6 +1275,9 @@ def generate_songbook(
                                 else None
                             ),
                         )
+                # The merged PDF can be hundreds of MB. Drop the prefetched copy
+                # now instead of holding it through the postface and the save.
+                merged_pdf_future = None
                 current_page = len(songbook_pdf)
                 if files:  # Only set if there are actual song files
                     page_indices["body"] = {
@@ -1103,11 +1294,11 @@ def generate_songbook(
                         with tracer.start_as_current_span(
                             "add_postface_files"
                         ) as postface_span:
-                            for i, file in enumerate(postface_files):
+                            for i, (file, stream_future) in enumerate(
+                                zip(postface_files, postface_streams)
+                            ):
                                 with (
-                                    gdrive_client.download_file_stream(
-                                        file
-                                    ) as pdf_stream,
+                                    stream_future.result() as pdf_stream,
                                     fitz.open(stream=pdf_stream) as pdf_document,
                                 ):
                                     is_last_postface = i == len(postface_files) - 1
@@ -1167,7 +1358,7 @@ def generate_songbook(
                     with tracer.start_as_current_span("save_pdf") as save_span:
                         destination_path.parent.mkdir(parents=True, exist_ok=True)
                         final_page_count = len(songbook_pdf)
-                        songbook_pdf.ez_save(destination_path)  # Save the merged PDF
+                        _save_songbook_pdf(songbook_pdf, destination_path)
                         if not os.path.exists(destination_path):
                             raise FileNotFoundError(
                                 f"Failed to save master PDF at {destination_path}"
@@ -1469,13 +1660,11 @@ def add_pride_flags(page, file, decorations, title_rect):
 
 def add_difficulty_wheel(page, file):
     difficulty_bin_str = file.properties.get("difficulty_bin")
-    if not difficulty_bin_str:
-        return
-    try:
-        difficulty_bin = int(difficulty_bin_str)
-    except (ValueError, TypeError):
+    # Bins are written by assign_difficulty_bins as plain non-negative
+    # integers, so a digit check replaces a try/int()/except per song.
+    if not isinstance(difficulty_bin_str, str) or not difficulty_bin_str.isdecimal():
         return
-    symbol = toc.difficulty_symbol(difficulty_bin)
+    symbol = toc.difficulty_symbol(int(difficulty_bin_str))
     if not symbol:
         return
     font = resolve_font("RobotoCondensed-Regular.ttf")
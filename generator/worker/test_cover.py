@@ -1,4 +1,6 @@
 import json
+from datetime import date
+
 import arrow
 import pytest
 from unittest.mock import Mock, patch
@@ -6,15 +8,30 @@ import fitz
 from . import cover
 from ..common import config
 
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.http import HttpMockSequence
 
+# Parsed once for the module; each test binds its own mock HTTP sequence.
+_DOCS_DISCOVERY_DOC = get_static_doc("docs", "v1")
+
+
+def _docs_service(http):
+    return build_from_document(_DOCS_DISCOVERY_DOC, http=http)
+
+
+@pytest.fixture(autouse=True)
+def no_google_auth(monkeypatch):
+    """Keep tests away from real credentials and service discovery."""
+    monkeypatch.setattr(cover, "get_credentials", Mock(return_value=Mock()))
+    monkeypatch.setattr(cover, "build", Mock())
+
 
 @patch("generator.worker.cover.click.echo")
 def test_apply_template_replacements_permission_error(mock_echo):
     """Test that a permission error is handled gracefully."""
     docs_http = HttpMockSequence([({"status": "403"}, "Permission denied")])
-    docs = build("docs", "v1", http=docs_http)
+    docs = _docs_service(docs_http)
     mock_config = config.Cover(file_id="doc123")
     generator = cover.CoverGenerator(
         gdrive_client=Mock(spec=cover.GoogleDriveClient),
@@ -28,21 +45,19 @@ def test_apply_template_replacements_permission_error(mock_echo):
     assert "Warning: Could not apply template" in mock_echo.call_args[0][0]
 
 
-@patch("generator.common.gdrive.GoogleDriveClient.download_file")
 @patch("generator.worker.cover.CoverGenerator._apply_template_replacements")
-def test_generate_cover_with_templating(mock_apply_replacements, mock_download_file):
+def test_generate_cover_with_templating(mock_apply_replacements):
     """Test that templating is applied, reverted, and PDF is exported."""
     mock_gdrive_client = Mock(spec=cover.GoogleDriveClient)
     mock_docs = Mock()
-    mock_download_file.return_value = b"fake-pdf-content"  # Fix for fitz.open
+    mock_gdrive_client.download_file.return_value = b"fake-pdf-content"
     mock_apply_replacements.return_value = {"{{DATE}}": 1, "{{NEXT_TUESDAY}}": 1}
     mock_config = config.Cover(file_id="cover123")
 
     generator = cover.CoverGenerator(
         mock_gdrive_client, mock_docs, mock_config, enable_templating=True
     )
-    with patch("fitz.open"):
-        generator.generate_cover("cover123")
+    assert generator.fetch_cover_pdf("cover123") == b"fake-pdf-content"
 
     # Check that replacements were applied and then reverted
     assert mock_apply_replacements.call_count == 2
@@ -52,11 +67,10 @@ def test_generate_cover_with_templating(mock_apply_replacements, mock_download_f
         cache_prefix="covers",
         mime_type="application/pdf",
         export=True,
+        use_cache=False,
     )
 
 
-@patch("generator.worker.cover.get_credentials", return_value=(Mock(), None))
-@patch("generator.worker.cover.build")
 @patch("generator.worker.cover.GoogleDriveClient")
 @patch("generator.worker.cover.CoverGenerator")
 @patch("generator.worker.cover.arrow.now")
@@ -64,8 +78,6 @@ def test_generate_cover_basic(
     mock_now,
     mock_cover_generator_class,
     mock_gdrive_client_class,
-    mock_build,
-    mock_get_credentials,
     tmp_path,
 ):
     """Test basic cover generation functionality."""
@@ -129,15 +141,11 @@ def test_generate_cover_templating_disabled(mock_fitz):
     mock_fitz.assert_called_once_with(stream=mock_pdf_data, filetype="pdf")
 
 
-@patch("generator.worker.cover.get_credentials", return_value=(Mock(), None))
-@patch("generator.worker.cover.build")
 @patch("generator.worker.cover.GoogleDriveClient")
 @patch("generator.worker.cover.CoverGenerator")
 def test_generate_cover_corrupted_pdf(
     mock_cover_generator_class,
     mock_gdrive_client_class,
-    mock_build,
-    mock_get_credentials,
     tmp_path,
 ):
     """Test handling of corrupted PDF file."""
@@ -156,11 +164,8 @@ def test_generate_cover_corrupted_pdf(
         cover.generate_cover(mock_cache_instance, "cover123")
 
 
-@patch("generator.common.gdrive.GoogleDriveClient.download_file")
 @patch("generator.worker.cover.CoverGenerator._apply_template_replacements")
-def test_generate_cover_uses_provided_cover_id(
-    mock_apply_replacements, mock_download_file
-):
+def test_generate_cover_uses_provided_cover_id(mock_apply_replacements):
     """Test that a provided cover_file_id is used instead of the one from config."""
     # This config has a different file_id
     mock_config = config.Cover(file_id="config_cover_id")
@@ -168,16 +173,15 @@ def test_generate_cover_uses_provided_cover_id(
     # Mock services
     mock_gdrive_client = Mock(spec=cover.GoogleDriveClient)
     mock_docs = Mock()
-    mock_download_file.return_value = b"fake-pdf-content"
+    mock_gdrive_client.download_file.return_value = b"fake-pdf-content"
     mock_apply_replacements.return_value = {"{{NEXT_TUESDAY}}": 1}
 
     generator = cover.CoverGenerator(
         mock_gdrive_client, mock_docs, mock_config, enable_templating=True
     )
 
-    with patch("fitz.open"):
-        # Call generate_cover with a specific file_id
-        generator.generate_cover(cover_file_id="provided_cover_id")
+    # Fetch the cover with a specific file_id
+    generator.fetch_cover_pdf(cover_file_id="provided_cover_id")
 
     # Assert that download_file was called with the provided_cover_id, not the one from config
     mock_gdrive_client.download_file.assert_called_once()
@@ -200,17 +204,27 @@ def test_next_tuesday(today, expected):
     assert result.format("YYYY-MM-DD") == expected
 
 
-@patch("generator.common.gdrive.GoogleDriveClient.download_file")
+def test_formatted_cover_dates_cached_per_day():
+    """Formatted dates are computed once per calendar day."""
+    cover._formatted_cover_dates.cache_clear()
+
+    first = cover._formatted_cover_dates(date(2026, 6, 15))
+    second = cover._formatted_cover_dates(date(2026, 6, 15))
+
+    assert first == ("15th June 2026", "16th June 2026")
+    assert second is first
+    assert cover._formatted_cover_dates.cache_info().hits == 1
+
+
 @patch("generator.worker.cover.CoverGenerator._apply_template_replacements")
 @patch("generator.worker.cover.arrow.now")
 def test_generate_cover_templates_date_and_next_tuesday(
-    mock_now, mock_apply_replacements, mock_download_file
+    mock_now, mock_apply_replacements
 ):
     """The forward replacement maps both {{DATE}} and {{NEXT_TUESDAY}}."""
     # Monday 2026-06-15; the coming Tuesday is 2026-06-16.
     mock_now.return_value = arrow.get("2026-06-15")
     mock_apply_replacements.return_value = {"{{DATE}}": 1, "{{NEXT_TUESDAY}}": 1}
-    mock_download_file.return_value = b"fake-pdf-content"
     mock_config = config.Cover(file_id="cover123")
 
     generator = cover.CoverGenerator(
@@ -219,8 +233,7 @@ def test_generate_cover_templates_date_and_next_tuesday(
         mock_config,
         enable_templating=True,
     )
-    with patch("fitz.open"):
-        generator.generate_cover("cover123")
+    generator.fetch_cover_pdf("cover123")
 
     forward_map = mock_apply_replacements.call_args_list[0].args[1]
     assert forward_map == {
@@ -240,7 +253,7 @@ def test_apply_template_replacements_returns_counts():
         }
     )
     docs_http = HttpMockSequence([({"status": "200"}, response_body)])
-    docs = build("docs", "v1", http=docs_http)
+    docs = _docs_service(docs_http)
     generator = cover.CoverGenerator(
         gdrive_client=Mock(spec=cover.GoogleDriveClient),
         docs_service=docs,
@@ -254,10 +267,10 @@ def test_apply_template_replacements_returns_counts():
     assert counts == {"{{DATE}}": 2, "{{NEXT_TUESDAY}}": 0}
 
 
-def test_apply_template_replacements_permission_error_returns_empty():
-    """A failed update returns an empty mapping so nothing is reverted."""
+def test_apply_template_replacements_permission_error_returns_none():
+    """A failed update returns None, distinct from zero replacements."""
     docs_http = HttpMockSequence([({"status": "403"}, "Permission denied")])
-    docs = build("docs", "v1", http=docs_http)
+    docs = _docs_service(docs_http)
     generator = cover.CoverGenerator(
         gdrive_client=Mock(spec=cover.GoogleDriveClient),
         docs_service=docs,
@@ -266,4 +279,114 @@ def test_apply_template_replacements_permission_error_returns_empty():
 
     counts = generator._apply_template_replacements("doc123", {"{{DATE}}": "value"})
 
-    assert counts == {}
+    assert counts is None
+
+
+@patch("generator.worker.cover.arrow.now")
+def test_fetch_cover_pdf_caches_templated_cover(mock_now, tmp_path):
+    """A templated cover is rendered once per day while the doc is unchanged."""
+    from datetime import datetime, timezone
+    from fsspec.implementations.local import LocalFileSystem
+    from ..common.caching.localstorage import LocalStorageCache
+
+    mock_now.return_value = arrow.get("2026-06-15")
+    cache = LocalStorageCache(LocalFileSystem(), str(tmp_path))
+    mock_gdrive_client = Mock(spec=cover.GoogleDriveClient)
+    mock_gdrive_client.get_modified_time.return_value = datetime(
+        2026, 6, 1, tzinfo=timezone.utc
+    )
+    mock_gdrive_client.download_file.return_value = b"rendered-cover"
+    generator = cover.CoverGenerator(
+        mock_gdrive_client, Mock(), config.Cover(file_id="cover123"), cache=cache
+    )
+
+    with patch.object(
+        generator, "_apply_template_replacements", return_value={"{{DATE}}": 1}
+    ) as mock_apply:
+        assert generator.fetch_cover_pdf() == b"rendered-cover"
+        assert generator.fetch_cover_pdf() == b"rendered-cover"
+
+    # Templated and reverted once; the second call is served from the cache.
+    assert mock_apply.call_count == 2
+    mock_gdrive_client.download_file.assert_called_once()
+    assert cache.get("covers/cover123-rendered.pdf") == b"rendered-cover"
+
+
+@patch("generator.worker.cover.arrow.now")
+def test_fetch_cover_pdf_rerenders_when_cover_doc_changes(mock_now):
+    """A cached cover older than the doc's last change is not used."""
+    from datetime import datetime, timezone
+
+    mock_now.return_value = arrow.get("2026-06-15")
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    modified = datetime(2026, 6, 15, 9, tzinfo=timezone.utc)
+    mock_gdrive_client = Mock(spec=cover.GoogleDriveClient)
+    mock_gdrive_client.get_modified_time.return_value = modified
+    mock_gdrive_client.download_file.return_value = b"new-cover"
+    generator = cover.CoverGenerator(
+        mock_gdrive_client, Mock(), config.Cover(file_id="cover123"), cache=mock_cache
+    )
+
+    with patch.object(generator, "_apply_template_replacements", return_value={}):
+        assert generator.fetch_cover_pdf() == b"new-cover"
+
+    mock_cache.get.assert_called_once_with(
+        "covers/cover123-rendered.pdf", newer_than=modified
+    )
+    mock_cache.put.assert_called_once_with("covers/cover123-rendered.pdf", b"new-cover")
+
+
+@patch("generator.worker.cover.arrow.now")
+def test_fetch_cover_pdf_rerenders_on_a_new_day(mock_now):
+    """The cached cover is replaced, not added to, once the date changes."""
+    from datetime import datetime, timezone
+
+    mock_now.return_value = arrow.get("2026-06-16T10:00:00")
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_gdrive_client = Mock(spec=cover.GoogleDriveClient)
+    mock_gdrive_client.get_modified_time.return_value = datetime(
+        2026, 6, 1, tzinfo=timezone.utc
+    )
+    mock_gdrive_client.download_file.return_value = b"new-cover"
+    generator = cover.CoverGenerator(
+        mock_gdrive_client, Mock(), config.Cover(file_id="cover123"), cache=mock_cache
+    )
+
+    with patch.object(generator, "_apply_template_replacements", return_value={}):
+        assert generator.fetch_cover_pdf() == b"new-cover"
+
+    # Only a copy written since midnight is current.
+    mock_cache.get.assert_called_once_with(
+        "covers/cover123-rendered.pdf",
+        newer_than=datetime(2026, 6, 16, tzinfo=timezone.utc),
+    )
+    mock_cache.put.assert_called_once_with("covers/cover123-rendered.pdf", b"new-cover")
+
+
+@patch("generator.worker.cover.arrow.now")
+def test_fetch_cover_pdf_does_not_cache_untemplated_cover(mock_now):
+    """A cover exported after templating failed is returned but not cached."""
+    from datetime import datetime, timezone
+
+    mock_now.return_value = arrow.get("2026-06-15")
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_gdrive_client = Mock(spec=cover.GoogleDriveClient)
+    mock_gdrive_client.get_modified_time.return_value = datetime(
+        2026, 6, 1, tzinfo=timezone.utc
+    )
+    mock_gdrive_client.download_file.return_value = b"raw-cover"
+    generator = cover.CoverGenerator(
+        mock_gdrive_client, Mock(), config.Cover(file_id="cover123"), cache=mock_cache
+    )
+
+    with patch.object(
+        generator, "_apply_template_replacements", return_value=None
+    ) as mock_apply:
+        assert generator.fetch_cover_pdf() == b"raw-cover"
+
+    # Nothing was replaced, so nothing is reverted either.
+    mock_apply.assert_called_once()
+    mock_cache.put.assert_not_called()
@@ -79,3 +79,43 @@ def test_assign_difficulty_bins_custom_bin_count():
     assign_difficulty_bins(files, num_bins=3)
     bins = [f.properties["difficulty_bin"] for f in files]
     assert bins == ["1", "2", "3"]
+
+
+def test_assign_difficulty_bins_parses_varied_numeric_formats():
+    """Integers, padded strings and numeric values are all accepted."""
+    files = [
+        File(id="1", name="A", properties={"difficulty": "1"}),
+        File(id="2", name="B", properties={"difficulty": " 3.0 "}),
+        File(id="3", name="C", properties={"difficulty": 5}),
+        File(id="4", name="D", properties={"difficulty": "3.0abc"}),
+        File(id="5", name="E", properties={"difficulty": None}),
+    ]
+    assign_difficulty_bins(files)
+    bins = [f.properties["difficulty_bin"] for f in files]
+    assert bins == ["1", "3", "5", "0", "0"]
+
+
+def test_assign_difficulty_bins_accepts_exponents_but_not_inf_or_nan():
+    """Exponent-form numbers parse; "inf" and "nan" are treated as missing."""
+    files = [
+        File(id="1", name="A", properties={"difficulty": "1e0"}),
+        File(id="2", name="B", properties={"difficulty": "3"}),
+        File(id="3", name="C", properties={"difficulty": "0.5E1"}),
+        File(id="4", name="D", properties={"difficulty": "inf"}),
+        File(id="5", name="E", properties={"difficulty": "nan"}),
+    ]
+    assign_difficulty_bins(files)
+    bins = [f.properties["difficulty_bin"] for f in files]
+    assert bins == ["1", "3", "5", "0", "0"]
+
+
+def test_assign_difficulty_bins_all_equal():
+    """When all valid difficulties are equal they land in the lowest bin."""
+    files = [
+        File(id="1", name="A", properties={"difficulty": "2.5"}),
+        File(id="2", name="B"),
+        File(id="3", name="C", properties={"difficulty": "2.5"}),
+    ]
+    assign_difficulty_bins(files)
+    bins = [f.properties["difficulty_bin"] for f in files]
+    assert bins == ["1", "0", "1"]
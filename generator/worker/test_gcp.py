@@ -0,0 +1,50 @@
+import pytest
+
+from . import gcp
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials_cache():
+    gcp._cached_credentials.cache_clear()
+    yield
+    gcp._cached_credentials.cache_clear()
+
+
+def test_get_credentials_cached_per_scopes(mocker):
+    """The ADC lookup runs once per distinct set of scopes."""
+    mock_default = mocker.patch(
+        "generator.worker.gcp.default",
+        side_effect=lambda scopes: (mocker.Mock(), "project"),
+    )
+
+    first = gcp.get_credentials(scopes=["b", "a"])
+    second = gcp.get_credentials(scopes=["a", "b"])
+    other = gcp.get_credentials(scopes=["c"])
+
+    assert first is second
+    assert other is not first
+    assert mock_default.call_count == 2
+    mock_default.assert_any_call(scopes=["a", "b"])
+
+
+def test_get_credentials_cached_per_target_principal(mocker):
+    """Impersonated credentials are keyed on the target principal too."""
+    mocker.patch(
+        "generator.worker.gcp.default", return_value=(mocker.Mock(), "project")
+    )
+    mock_impersonated = mocker.patch(
+        "generator.worker.gcp.impersonated_credentials.Credentials",
+        side_effect=lambda **kwargs: mocker.Mock(**kwargs),
+    )
+
+    plain = gcp.get_credentials(scopes=["a"])
+    impersonated = gcp.get_credentials(scopes=["a"], target_principal="sa@x")
+    again = gcp.get_credentials(scopes=["a"], target_principal="sa@x")
+
+    assert impersonated is again
+    assert impersonated is not plain
+    mock_impersonated.assert_called_once_with(
+        source_credentials=plain,
+        target_principal="sa@x",
+        target_scopes=["a"],
+    )
@@ -0,0 +1,419 @@
+import base64
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import fitz
+import pytest
+from google.api_core.exceptions import ServiceUnavailable
+from opentelemetry import trace
+
+from generator.worker import main
+
+
+def _cloud_event(job_id="job-1", params=None):
+    payload = json.dumps({"job_id": job_id, "params": params or {}})
+    event = Mock()
+    event.data = {"message": {"data": base64.b64encode(payload.encode("utf-8"))}}
+    return event
+
+
+@pytest.fixture
+def services(mocker):
+    """Replace the cached GCP services with mocks."""
+    job_ref = Mock()
+    db = Mock()
+    db.collection.return_value.document.return_value = job_ref
+    blobs = {}
+    cdn_bucket = Mock()
+    cdn_bucket.blob.side_effect = lambda name, **kwargs: blobs.setdefault(
+        name, Mock(public_url=f"https://cdn.example/{name}")
+    )
+    services = {
+        "tracer": trace.NoOpTracer(),
+        "db": db,
+        "cdn_bucket": cdn_bucket,
+        "firestore_collection": "jobs",
+        "gcs_cdn_bucket_name": "cdn",
+        "job_ref": job_ref,
+        "blobs": blobs,
+    }
+    # The claim logic is covered by the _claim_job tests; here the job is
+    # claimed unless a test says otherwise.
+    services["claim_job"] = Mock(return_value=None)
+    services["transactional"] = mocker.patch(
+        "generator.worker.main.firestore.transactional",
+        return_value=services["claim_job"],
+    )
+    mocker.patch("generator.worker.main._get_services", return_value=services)
+    return services
+
+
+class _FakeTransaction:
+    """Records the writes made in a job-claim transaction."""
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, ref, data):
+        self.updates.append((ref, data))
+
+
+def _job_ref(job):
+    """A job document holding *job*, or a missing one if *job* is None."""
+    job_ref = Mock()
+    job_ref.get.return_value.exists = job is not None
+    job_ref.get.return_value.to_dict.return_value = job
+    return job_ref
+
+
+def _claim(job_ref):
+    """Run the claim logic against a fake transaction."""
+    transaction = _FakeTransaction()
+    skipped_status = main._claim_job(transaction, job_ref)
+    return skipped_status, transaction
+
+
+@pytest.fixture
+def mock_generation(mocker):
+    """Stub out songbook generation with a tiny PDF written to disk."""
+    main._get_drive_and_cache.cache_clear()
+    mocker.patch("generator.worker.main.init_services", return_value=(Mock(), Mock()))
+
+    def _generate(destination_path, on_progress, **kwargs):
+        on_progress(0.5, "Halfway")
+        with fitz.open() as doc:
+            doc.new_page()
+            doc.save(destination_path)
+        return {"files": [], "title": None, "subject": None, "page_indices": {}}
+
+    return mocker.patch(
+        "generator.worker.main.generate_songbook", side_effect=_generate
+    )
+
+
+def _statuses(job_ref):
+    return [c.args[0]["status"] for c in job_ref.update.call_args_list]
+
+
+def test_make_progress_callback_flushes_last_tick_on_close():
+    """Every tick is written when there is no throttling, in order."""
+    job_ref = Mock()
+    callback = main.make_progress_callback(job_ref, min_interval=0)
+
+    callback(0.1, "first")
+    callback(1.0, "done")
+    callback.close()
+
+    last_update = job_ref.update.call_args_list[-1].args[0]
+    assert last_update["progress"] == 1.0
+    assert last_update["last_message"] == "done"
+
+
+def test_make_progress_callback_coalesces_ticks():
+    """Ticks within the interval are collapsed into the latest one."""
+    job_ref = Mock()
+    first_written = threading.Event()
+    job_ref.update.side_effect = lambda update: first_written.set()
+    callback = main.make_progress_callback(job_ref, min_interval=60)
+
+    callback(0.1, "first")
+    assert first_written.wait(timeout=5)
+    callback(0.2, "second")
+    callback(0.3, "third")
+    callback.close()
+
+    messages = [c.args[0]["last_message"] for c in job_ref.update.call_args_list]
+    assert messages == ["first", "third"]
+
+
+def test_make_progress_callback_does_not_block_on_firestore():
+    """A slow Firestore write does not hold up the caller."""
+    job_ref = Mock()
+    release = threading.Event()
+    job_ref.update.side_effect = lambda update: release.wait(timeout=5)
+    callback = main.make_progress_callback(job_ref, min_interval=0)
+
+    callback(0.1, "first")
+    callback(0.2, "second")
+    release.set()
+    callback.close()
+
+    assert job_ref.update.call_args_list[-1].args[0]["last_message"] == "second"
+
+
+def test_make_progress_callback_ignores_write_errors():
+    """A failed progress write is logged and does not stop later writes."""
+    job_ref = Mock()
+    attempted = threading.Event()
+
+    def _update(update):
+        if not attempted.is_set():
+            attempted.set()
+            raise ServiceUnavailable("blip")
+
+    job_ref.update.side_effect = _update
+    callback = main.make_progress_callback(job_ref, min_interval=0)
+
+    callback(0.1, "first")
+    assert attempted.wait(timeout=5)
+    callback(0.2, "second")
+    callback.close()
+
+    assert job_ref.update.call_count == 2
+
+
+def test_worker_main_progress_written_before_completion(services, mock_generation):
+    """No progress update lands after the COMPLETED status."""
+    main.worker_main(_cloud_event())
+
+    statuses = _statuses(services["job_ref"])
+    assert "RUNNING" in statuses[:-1]
+    assert statuses[-1] == "COMPLETED"
+
+
+def test_worker_main_marks_job_completed(services, mock_generation):
+    """A claimed job is marked COMPLETED with the uploaded URLs."""
+    main.worker_main(_cloud_event())
+
+    job_ref = services["job_ref"]
+    services["transactional"].assert_called_once_with(main._claim_job)
+    services["claim_job"].assert_called_once_with(
+        services["db"].transaction.return_value, job_ref
+    )
+    assert _statuses(job_ref)[-1] == "COMPLETED"
+    final_update = job_ref.update.call_args_list[-1].args[0]
+    assert final_update["result_url"] == "https://cdn.example/job-1/songbook.pdf"
+    assert final_update["manifest_url"] == "https://cdn.example/job-1/manifest.json"
+
+
+def test_worker_main_removes_temp_pdf(services, mock_generation):
+    """The generated PDF is deleted from local disk once uploaded."""
+    main.worker_main(_cloud_event())
+
+    destination_path = mock_generation.call_args.kwargs["destination_path"]
+    assert not destination_path.exists()
+
+
+def test_worker_main_removes_temp_pdf_on_failure(services, mock_generation):
+    """The temp PDF is also deleted when the job fails after generation."""
+    manifest_blob = services["cdn_bucket"].blob("job-1/manifest.json")
+    manifest_blob.upload_from_string.side_effect = OSError("network down")
+
+    with pytest.raises(OSError):
+        main.worker_main(_cloud_event())
+
+    destination_path = mock_generation.call_args.kwargs["destination_path"]
+    assert not destination_path.exists()
+
+
+def test_worker_main_uploads_pdf_and_manifest(services, mock_generation):
+    """Both artifacts are uploaded with their content types."""
+    main.worker_main(_cloud_event())
+
+    blobs = services["blobs"]
+    pdf_call = blobs["job-1/songbook.pdf"].upload_from_filename.call_args
+    manifest_call = blobs["job-1/manifest.json"].upload_from_string.call_args
+    assert pdf_call.kwargs["content_type"] == "application/pdf"
+    assert manifest_call.kwargs["content_type"] == "application/json"
+    assert json.loads(manifest_call.args[0])["job_id"] == "job-1"
+    services["cdn_bucket"].blob.assert_any_call(
+        "job-1/songbook.pdf", chunk_size=main.PDF_UPLOAD_CHUNK_SIZE
+    )
+
+
+def test_worker_main_upload_failure_marks_job_failed(services, mock_generation):
+    """A failed upload is surfaced and the job is not marked COMPLETED."""
+    manifest_blob = services["cdn_bucket"].blob("job-1/manifest.json")
+    manifest_blob.upload_from_string.side_effect = OSError("network down")
+
+    with pytest.raises(OSError, match="network down"):
+        main.worker_main(_cloud_event())
+
+    statuses = _statuses(services["job_ref"])
+    assert "COMPLETED" not in statuses
+    assert statuses[-1] == "FAILED"
+
+
+def test_worker_main_reuses_drive_and_cache(services, mock_generation):
+    """Drive and cache are initialized once and reused by later jobs."""
+    main.worker_main(_cloud_event(job_id="job-1"))
+    main.worker_main(_cloud_event(job_id="job-2"))
+
+    main.init_services.assert_called_once_with()
+    first, second = mock_generation.call_args_list
+    assert first.kwargs["drive"] is second.kwargs["drive"]
+    assert first.kwargs["cache"] is second.kwargs["cache"]
+
+
+def test_worker_main_marks_job_failed(services, mock_generation):
+    """A generation error marks the job FAILED and is re-raised."""
+    mock_generation.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        main.worker_main(_cloud_event())
+
+    job_ref = services["job_ref"]
+    assert _statuses(job_ref)[-1] == "FAILED"
+    assert job_ref.update.call_args_list[-1].args[0]["error"] == "RuntimeError: boom"
+
+
+def test_worker_main_failed_status_write_does_not_mask_error(services, mock_generation):
+    """If marking the job FAILED errors too, the original error still surfaces."""
+    mock_generation.side_effect = RuntimeError("boom")
+    job_ref = services["job_ref"]
+
+    def _update(fields, **kwargs):
+        if fields["status"] == "FAILED":
+            raise ServiceUnavailable("firestore down")
+
+    job_ref.update.side_effect = _update
+
+    with pytest.raises(RuntimeError, match="boom"):
+        main.worker_main(_cloud_event())
+
+    assert job_ref.update.call_args_list[-1].kwargs == {
+        "timeout": main.FAILED_STATUS_TIMEOUT_SECONDS
+    }
+
+
+def test_worker_main_skips_completed_job(services, mock_generation):
+    """A redelivered message for a completed job is acknowledged as a no-op."""
+    services["claim_job"].return_value = "COMPLETED"
+
+    main.worker_main(_cloud_event())
+
+    mock_generation.assert_not_called()
+    services["job_ref"].update.assert_not_called()
+    services["cdn_bucket"].blob.assert_not_called()
+
+
+def test_worker_main_does_not_retry_job_running_elsewhere(
+    services, mock_generation
+):
+    """
+    A delivery for a job still within its lease is acked without building.
+
+    The worker is deployed without --retry, so this is the only chance the
+    message gets: if the attempt holding the lease has crashed, the job is
+    not retried.
+    """
+    services["claim_job"].return_value = "RUNNING"
+
+    assert main.worker_main(_cloud_event()) is None
+
+    mock_generation.assert_not_called()
+    services["job_ref"].update.assert_not_called()
+    services["cdn_bucket"].blob.assert_not_called()
+
+
+def test_claim_job_skips_completed_job():
+    """A completed job is not claimed again."""
+    skipped_status, transaction = _claim(_job_ref({"status": "COMPLETED"}))
+
+    assert skipped_status == "COMPLETED"
+    assert transaction.updates == []
+
+
+def test_claim_job_skips_job_running_elsewhere():
+    """A job whose lease hasn't run out is left to the attempt running it."""
+    job_ref = _job_ref(
+        {
+            "status": "RUNNING",
+            "started_at": datetime.now(timezone.utc) - timedelta(minutes=1),
+        }
+    )
+
+    skipped_status, transaction = _claim(job_ref)
+
+    assert skipped_status == "RUNNING"
+    assert transaction.updates == []
+
+
+@pytest.mark.parametrize(
+    "job",
+    [
+        {"status": "QUEUED"},
+        {"status": "FAILED"},
+        # An attempt that crashed or timed out before finishing.
+        {
+            "status": "RUNNING",
+            "started_at": datetime.now(timezone.utc)
+            - timedelta(seconds=main.JOB_CLAIM_LEASE_SECONDS + 60),
+        },
+        {"status": "RUNNING"},
+        None,
+    ],
+)
+def test_claim_job_claims_unfinished_job(job):
+    """Jobs that did not complete and aren't being worked on are (re)claimed."""
+    job_ref = _job_ref(job)
+
+    skipped_status, transaction = _claim(job_ref)
+
+    assert skipped_status is None
+    assert transaction.updates == [
+        (
+            job_ref,
+            {"status": "RUNNING", "started_at": main.firestore.SERVER_TIMESTAMP},
+        )
+    ]
+    job_ref.get.assert_called_once_with(transaction=transaction)
+
+
+def test_worker_main_decodes_utf8_payload(services, mock_generation):
+    """Non-ASCII params survive decoding straight from the payload bytes."""
+    main.worker_main(_cloud_event(params={"title": "Chansons d'été"}))
+
+    manifest_blob = services["blobs"]["job-1/manifest.json"]
+    manifest = json.loads(manifest_blob.upload_from_string.call_args.args[0])
+    assert manifest["input_parameters"] == {"title": "Chansons d'été"}
+
+
+def test_warm_up_primes_firestore(services):
+    """Warm-up issues a read so the Firestore channel is established."""
+    main._warm_up()
+
+    services["db"].collection.assert_called_with("jobs")
+    services["db"].collection.return_value.document.assert_called_with("_warmup")
+    services["job_ref"].get.assert_called_once()
+
+
+def test_warm_up_tolerates_firestore_errors(services):
+    """A failed warm-up read does not prevent the worker from starting."""
+    services["job_ref"].get.side_effect = ServiceUnavailable("cold")
+
+    main._warm_up()
+
+
+def test_upload_pdf_small_file_uses_single_upload(mocker):
+    """Files under the threshold use a plain (resumable) upload."""
+    mock_parallel = mocker.patch(
+        "generator.worker.main.transfer_manager.upload_chunks_concurrently"
+    )
+    blob = Mock()
+
+    main._upload_pdf(blob, "/tmp/songbook.pdf", 1024)
+
+    blob.upload_from_filename.assert_called_once_with(
+        "/tmp/songbook.pdf", content_type="application/pdf"
+    )
+    mock_parallel.assert_not_called()
+
+
+def test_upload_pdf_large_file_uses_parallel_upload(mocker):
+    """Files over the threshold are uploaded in parallel parts."""
+    mock_parallel = mocker.patch(
+        "generator.worker.main.transfer_manager.upload_chunks_concurrently"
+    )
+    blob = Mock()
+
+    main._upload_pdf(
+        blob, "/tmp/songbook.pdf", main.PARALLEL_UPLOAD_THRESHOLD_BYTES + 1
+    )
+
+    mock_parallel.assert_called_once()
+    assert mock_parallel.call_args.args == ("/tmp/songbook.pdf", blob)
+    assert mock_parallel.call_args.kwargs["worker_type"] == "thread"
+    blob.upload_from_filename.assert_not_called()
@@ -1,11 +1,23 @@
+import functools
 import fitz
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
+from fsspec.implementations.local import LocalFileSystem
+from ..common.caching.localstorage import LocalStorageCache
 from ..common.config import Edition
 from ..common.song_source import SongSheetSource
 from .pdf import (
+    _normalize_song_title,
+    _cover_services,
+    _find_song_title,
+    _prefetch_file_streams,
+    _prefetch_merged_pdf,
     _resolve_songs_from_folder,
+    _save_songbook_pdf,
+    _sort_titles,
+    _title_sort_key,
+    add_difficulty_wheel,
     add_page_number,
     categorize_folder_files,
     collect_and_sort_files,
@@ -17,13 +29,25 @@ from .pdf import (
     load_edition_from_drive_folder,
     resolve_folder_components,
 )
-from .exceptions import PdfCacheMissException, PdfCacheNotFound
+from .exceptions import (
+    CoverGenerationException,
+    PdfCacheMissException,
+    PdfCacheNotFound,
+)
 from ..common.filters import PropertyFilter, FilterOperator, FilterGroup
 from .models import File
+from . import cover as cover_mod
 
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
 
 
+@pytest.fixture(autouse=True)
+def clear_title_sort_key_cache():
+    _title_sort_key.cache_clear()
+    yield
+    _title_sort_key.cache_clear()
+
+
 @pytest.fixture
 def mock_gdrive_client(mocker):
     """Fixture to mock GoogleDriveClient."""
@@ -139,7 +163,7 @@ def test_generate_songbook_sets_metadata(mocker, tmp_path):
     mocker.patch("generator.worker.pdf.get_credentials")
     mocker.patch("generator.common.metadata_store.get_metadata_store")
     mocker.patch(
-        "generator.worker.cover.CoverGenerator.generate_cover", return_value=fitz.open()
+        "generator.worker.cover.CoverGenerator.fetch_cover_pdf", return_value=None
     )
     mocker.patch(
         "generator.worker.toc.build_table_of_contents",
@@ -172,6 +196,184 @@ def test_generate_songbook_sets_metadata(mocker, tmp_path):
         assert metadata["creator"] == "Ukulele Tuesday Songbook Generator"
 
 
+def test_generate_songbook_prefetched_cover_error_propagates(mocker, tmp_path):
+    """A cover failure on the prefetch thread is raised by generate_songbook."""
+    mocker.patch(
+        "generator.worker.pdf.collect_and_sort_files",
+        return_value=[File(name="Test Song.pdf", id="123")],
+    )
+    mocker.patch("generator.worker.pdf.get_credentials")
+    mocker.patch("generator.common.metadata_store.get_metadata_store")
+    mocker.patch(
+        "generator.worker.cover.CoverGenerator.fetch_cover_pdf",
+        side_effect=CoverGenerationException("corrupted"),
+    )
+    mock_copy_pdfs = mocker.patch("generator.worker.pdf.copy_pdfs")
+
+    with pytest.raises(CoverGenerationException, match="corrupted"):
+        generate_songbook(
+            drive=mocker.Mock(),
+            cache=mocker.Mock(),
+            source_folders=["folder1"],
+            destination_path=tmp_path / "songbook.pdf",
+            limit=None,
+            cover_file_id="cover123",
+        )
+    mock_copy_pdfs.assert_not_called()
+
+
+def test_generate_songbook_no_files_skips_prefetch(mocker, tmp_path):
+    """Nothing is prefetched when there are no songs to build a book from."""
+    mocker.patch("generator.worker.pdf.collect_and_sort_files", return_value=[])
+    mocker.patch("generator.worker.pdf.get_credentials")
+    mocker.patch("generator.common.metadata_store.get_metadata_store")
+    mock_prefetch_cover = mocker.patch("generator.worker.pdf._prefetch_cover")
+    mock_prefetch_merged_pdf = mocker.patch("generator.worker.pdf._prefetch_merged_pdf")
+
+    generate_songbook(
+        drive=mocker.Mock(),
+        cache=mocker.Mock(),
+        source_folders=["folder1"],
+        destination_path=tmp_path / "songbook.pdf",
+        limit=None,
+        cover_file_id="cover123",
+    )
+
+    mock_prefetch_cover.assert_not_called()
+    mock_prefetch_merged_pdf.assert_not_called()
+    assert not (tmp_path / "songbook.pdf").exists()
+
+
+def test_generate_songbook_opens_prefetched_cover_on_calling_thread(mocker, tmp_path):
+    """Only the cover download runs in the background; PyMuPDF is not used
+    there, so a corrupted download is reported from the calling thread."""
+    import threading
+
+    mocker.patch(
+        "generator.worker.pdf.collect_and_sort_files",
+        return_value=[File(name="Test Song.pdf", id="123")],
+    )
+    mocker.patch("generator.worker.pdf.get_credentials")
+    mocker.patch("generator.common.metadata_store.get_metadata_store")
+    mocker.patch(
+        "generator.worker.cover.CoverGenerator.fetch_cover_pdf", return_value=b""
+    )
+    open_threads = []
+    real_open_cover_pdf = cover_mod.open_cover_pdf
+
+    def _open_cover_pdf(data):
+        open_threads.append(threading.current_thread())
+        return real_open_cover_pdf(data)
+
+    mocker.patch("generator.worker.cover.open_cover_pdf", side_effect=_open_cover_pdf)
+
+    with pytest.raises(CoverGenerationException, match="corrupted"):
+        generate_songbook(
+            drive=mocker.Mock(),
+            cache=mocker.Mock(),
+            source_folders=["folder1"],
+            destination_path=tmp_path / "songbook.pdf",
+            limit=None,
+            cover_file_id="cover123",
+        )
+    assert open_threads == [threading.current_thread()]
+
+
+def test_cover_services_built_once_per_credentials(mocker):
+    """The cover's Docs/Drive clients are reused across builds."""
+    _cover_services.cache_clear()
+    mock_build = mocker.patch(
+        "generator.worker.pdf.build_service", side_effect=lambda *args: mocker.Mock()
+    )
+    creds = mocker.Mock()
+
+    try:
+        assert _cover_services(creds) is _cover_services(creds)
+    finally:
+        _cover_services.cache_clear()
+
+    assert [c.args[:2] for c in mock_build.call_args_list] == [
+        ("docs", "v1"),
+        ("drive", "v3"),
+    ]
+
+
+def test_prefetch_file_streams_downloads_concurrently_in_order(mocker):
+    """Preface/postface downloads overlap and come back in file order."""
+    import io
+    import threading
+
+    files = [File(name=f"_preface {i}", id=str(i)) for i in range(3)]
+    all_started = threading.Barrier(len(files), timeout=5)
+
+    def _download(file):
+        # Only passes if every download is in flight at the same time.
+        all_started.wait()
+        return io.BytesIO(file.id.encode())
+
+    gdrive_client = mocker.Mock()
+    gdrive_client.download_file_stream.side_effect = _download
+
+    futures = _prefetch_file_streams(gdrive_client, files)
+
+    assert [f.result(timeout=5).getvalue() for f in futures] == [b"0", b"1", b"2"]
+
+
+def test_prefetch_file_streams_no_files(mocker):
+    assert _prefetch_file_streams(mocker.Mock(), []) == []
+
+
+def test_prefetch_merged_pdf_downloads_from_remote_cache(mocker):
+    """A remote cache's merged PDF is fetched off the calling thread."""
+    import threading
+
+    caller = threading.current_thread()
+    mock_cache = mocker.Mock()
+    mock_cache.local_path.return_value = None
+    mock_cache.get.side_effect = lambda key: (
+        b"pdf" if threading.current_thread() is not caller else None
+    )
+
+    assert _prefetch_merged_pdf(mock_cache).result(timeout=5) == b"pdf"
+    mock_cache.get.assert_called_once_with("merged-pdf/latest.pdf")
+
+
+def test_prefetch_merged_pdf_skips_local_cache(mocker):
+    """A local cache is opened in place, so there is nothing to prefetch."""
+    mock_cache = mocker.Mock()
+    mock_cache.local_path.return_value = "/cache/merged-pdf/latest.pdf"
+
+    assert _prefetch_merged_pdf(mock_cache).result(timeout=5) is None
+    mock_cache.get.assert_not_called()
+
+
+@pytest.mark.parametrize("title_y", [72, 600])
+def test_find_song_title(title_y):
+    """Titles are found at the top of the page and, failing that, lower down."""
+    with fitz.open() as doc:
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((72, title_y), "Wonderwall", fontsize=20)
+
+        rects = _find_song_title(page, "Wonderwall")
+
+    assert len(rects) == 1
+    assert rects[0].y0 < title_y < rects[0].y1
+
+
+def test_find_song_title_prefers_header():
+    """A title repeated further down the page is not matched when the header
+    already has it."""
+    with fitz.open() as doc:
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((72, 72), "Wonderwall", fontsize=20)
+        page.insert_text((72, 600), "Wonderwall", fontsize=12)
+
+        rects = _find_song_title(page, "Wonderwall")
+
+    assert len(rects) == 1
+    assert rects[0].y0 < 72 < rects[0].y1
+
+
 def test_collect_and_sort_files_single_folder(mocker, mock_gdrive_client):
     """Test that files from a single folder are returned sorted by name."""
     # Mock files in non-alphabetical order
@@ -189,12 +391,7 @@ def test_collect_and_sort_files_single_folder(mocker, mock_gdrive_client):
     )
 
     # Should be sorted alphabetically by name
-    expected = [
-        File(name="apple.pdf", id="1"),
-        File(name="banana.pdf", id="2"),
-        File(name="zebra.pdf", id="3"),
-    ]
-    assert result == expected
+    assert [f.id for f in result] == ["1", "2", "3"]
 
     # Verify the query was called correctly
     mock_gdrive_client.query_drive_files_with_client_filter.assert_called_once_with(
@@ -223,13 +420,7 @@ def test_collect_and_sort_files_multiple_folders(mocker, mock_gdrive_client):
     )
 
     # Should be sorted alphabetically across all folders
-    expected = [
-        File(name="apple.pdf", id="3"),
-        File(name="banana.pdf", id="2"),
-        File(name="cherry.pdf", id="4"),
-        File(name="zebra.pdf", id="1"),
-    ]
-    assert result == expected
+    assert [f.id for f in result] == ["3", "2", "4", "1"]
 
     # Verify query was called once with both folders
     mock_gdrive_client.query_drive_files_with_client_filter.assert_called_once_with(
@@ -317,13 +508,31 @@ def test_collect_and_sort_files_no_progress_step(mocker, mock_gdrive_client):
     assert result == mock_files
 
 
-def test_collect_and_sort_files_strips_artist_name(mocker, mock_gdrive_client):
-    """Test that sorting handles different cases correctly."""
-    mock_files = [
-        File(name="ab - a.pdf", id="1"),
-        File(name="a - cd.pdf", id="2"),
-    ]
-
+@pytest.mark.parametrize(
+    "names,expected_ids",
+    [
+        pytest.param(["ab - a.pdf", "a - cd.pdf"], ["1", "0"], id="strips_artist_name"),
+        pytest.param(
+            ["Zebra.pdf", "apple.pdf", "Banana.pdf"],
+            ["1", "2", "0"],
+            id="case_insensitive",
+        ),
+        pytest.param(
+            ["!!banana.pdf", "apple", "cucumber.pdf"],
+            ["1", "0", "2"],
+            id="strips_punctuation",
+        ),
+        pytest.param(["çb.pdf", "ca", "cz.pdf"], ["1", "0", "2"], id="accents"),
+        pytest.param(
+            ["01 things.pdf", "things 100 things", "things 001 things.pdf"],
+            ["0", "2", "1"],
+            id="numerals",
+        ),
+    ],
+)
+def test_collect_and_sort_files_sort_order(mock_gdrive_client, names, expected_ids):
+    """Songs are ordered by their normalized title."""
+    mock_files = [File(name=name, id=str(i)) for i, name in enumerate(names)]
     mock_gdrive_client.query_drive_files_with_client_filter.return_value = mock_files
 
     result = collect_and_sort_files(
@@ -331,65 +540,71 @@ def test_collect_and_sort_files_strips_artist_name(mocker, mock_gdrive_client):
         source_folders=["folder1"],
     )
 
-    expected = [
-        File(name="a - cd.pdf", id="2"),
-        File(name="ab - a.pdf", id="1"),
-    ]
-    assert result == expected
-
+    assert [f.id for f in result] == expected_ids
 
-def test_collect_and_sort_files_case_sensitive_sorting(mocker, mock_gdrive_client):
-    """Test that sorting handles different cases correctly."""
-    mock_files = [
-        File(name="Zebra.pdf", id="1"),
-        File(name="apple.pdf", id="2"),
-        File(name="Banana.pdf", id="3"),
-    ]
 
+def test_collect_and_sort_files_computes_sort_key_once_per_file(
+    mocker, mock_gdrive_client
+):
+    """Each title is normalized once, not once per comparison."""
+    mock_files = [File(name=f"Café {i} - Artist", id=str(i)) for i in range(50, 0, -1)]
     mock_gdrive_client.query_drive_files_with_client_filter.return_value = mock_files
+    mock_unidecode = mocker.patch(
+        "generator.worker.pdf.unidecode", side_effect=lambda s: s
+    )
 
     result = collect_and_sort_files(
         song_source=SongSheetSource(mock_gdrive_client),
         source_folders=["folder1"],
     )
 
-    expected = [
-        File(name="apple.pdf", id="2"),
-        File(name="Banana.pdf", id="3"),
-        File(name="Zebra.pdf", id="1"),
-    ]
-    assert result == expected
+    assert [f.id for f in result] == [str(i) for i in range(1, 51)]
+    assert mock_unidecode.call_count == len(mock_files)
 
 
-def test_collect_and_sort_files_strips_punctuation(mocker, mock_gdrive_client):
-    mock_files = [
-        File(name="!!banana.pdf", id="1"),
-        File(name="apple", id="2"),
-        File(name="cucumber.pdf", id="3"),
-    ]
+def test_sort_titles_reuses_keys_across_sorts(mocker):
+    """A title normalized for one sort is not normalized again for the next."""
+    files = [File(name=f"Café {i}", id=str(i)) for i in range(5)]
+    mock_unidecode = mocker.patch(
+        "generator.worker.pdf.unidecode", side_effect=lambda s: s
+    )
+
+    first = _sort_titles(files)
+    second = _sort_titles(list(reversed(files)))
+
+    assert first == second
+    assert mock_unidecode.call_count == len(files)
 
+
+def test_collect_and_sort_files_skips_unidecode_for_ascii_titles(
+    mocker, mock_gdrive_client
+):
+    """Plain ASCII titles are used as-is without transliteration."""
+    mock_files = [File(name="Zebra", id="1"), File(name="Ãpple", id="2")]
     mock_gdrive_client.query_drive_files_with_client_filter.return_value = mock_files
+    mock_unidecode = mocker.patch(
+        "generator.worker.pdf.unidecode", side_effect=lambda s: "Apple"
+    )
 
     result = collect_and_sort_files(
         song_source=SongSheetSource(mock_gdrive_client),
         source_folders=["folder1"],
     )
 
-    expected = [
-        File(name="apple", id="2"),
-        File(name="!!banana.pdf", id="1"),
-        File(name="cucumber.pdf", id="3"),
-    ]
-    assert result == expected
+    assert [f.id for f in result] == ["2", "1"]
+    mock_unidecode.assert_called_once_with("Ãpple")
 
 
-def test_collect_and_sort_files_accent_sensitive_sorting(mocker, mock_gdrive_client):
+def test_collect_and_sort_files_ignores_punctuation_and_spacing(
+    mocker, mock_gdrive_client
+):
+    """Punctuation, underscores and spaces don't affect the sort order."""
     mock_files = [
-        File(name="çb.pdf", id="1"),
-        File(name="ca", id="2"),
-        File(name="cz.pdf", id="3"),
+        File(name="_Zombie - The Cranberries", id="1"),
+        File(name="(I Can't Get No) Satisfaction", id="2"),
+        File(name="Ça Plane Pour Moi", id="3"),
+        File(name="A-Ha! Take On Me", id="4"),
     ]
-
     mock_gdrive_client.query_drive_files_with_client_filter.return_value = mock_files
 
     result = collect_and_sort_files(
@@ -397,33 +612,23 @@ def test_collect_and_sort_files_accent_sensitive_sorting(mocker, mock_gdrive_cli
         source_folders=["folder1"],
     )
 
-    expected = [
-        File(name="ca", id="2"),
-        File(name="çb.pdf", id="1"),
-        File(name="cz.pdf", id="3"),
-    ]
-    assert result == expected
+    assert [f.id for f in result] == ["4", "3", "2", "1"]
 
 
-def test_collect_and_sort_files_numeral_sensitive_sorting(mocker, mock_gdrive_client):
-    mock_files = [
-        File(name="01 things.pdf", id="1"),
-        File(name="things 100 things", id="2"),
-        File(name="things 001 things.pdf", id="3"),
-    ]
+def test_sort_titles_matches_natsort_order():
+    """Titles sort exactly as natsort would order their normalized keys."""
+    import random
 
-    mock_gdrive_client.query_drive_files_with_client_filter.return_value = mock_files
+    from natsort import natsort_keygen
 
-    result = collect_and_sort_files(
-        song_source=SongSheetSource(mock_gdrive_client),
-        source_folders=["folder1"],
-    )
-    expected = [
-        File(name="01 things.pdf", id="1"),
-        File(name="things 001 things.pdf", id="3"),
-        File(name="things 100 things", id="2"),
+    rng = random.Random(0)
+    files = [
+        File(name="".join(rng.choice("ab 0129-") for _ in range(12)), id=str(i))
+        for i in range(500)
     ]
-    assert result == expected
+    natsort_key = natsort_keygen(key=lambda f: _normalize_song_title(f.name))
+
+    assert _sort_titles(files) == sorted(files, key=natsort_key)
 
 
 def test_collect_and_sort_files_progress_increment_calculation(
@@ -477,15 +682,20 @@ def test_collect_and_sort_files_mixed_empty_and_non_empty_folders(
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _blank_pdf_bytes(page_count: int) -> bytes:
+    """A blank PDF with *page_count* pages, built once per test session."""
+    with fitz.open() as doc:
+        for _ in range(page_count):
+            doc.new_page()
+        return doc.tobytes()
+
+
 def test_generate_manifest(tmp_path):
     """Test that generate_manifest creates comprehensive metadata."""
     # Create a temporary PDF for testing
     pdf_path = tmp_path / "test.pdf"
-    doc = fitz.open()  # Create empty PDF
-    doc.new_page()
-    doc.new_page()  # 2 pages
-    doc.save(pdf_path)
-    doc.close()
+    pdf_path.write_bytes(_blank_pdf_bytes(2))
 
     # Create test data
     job_id = "test-job-123"
@@ -572,10 +782,7 @@ def test_generate_manifest_without_edition(tmp_path):
     """Test that generate_manifest works without an edition (legacy mode)."""
     # Create a temporary PDF for testing
     pdf_path = tmp_path / "test.pdf"
-    doc = fitz.open()
-    doc.new_page()
-    doc.save(pdf_path)
-    doc.close()
+    pdf_path.write_bytes(_blank_pdf_bytes(1))
 
     # Create minimal test data
     job_id = "test-job-456"
@@ -603,12 +810,7 @@ def test_generate_manifest_with_page_indices(tmp_path):
     """Test that generate_manifest includes page indices when provided."""
     # Create a temporary PDF for testing
     pdf_path = tmp_path / "test.pdf"
-    doc = fitz.open()
-    doc.new_page()
-    doc.new_page()
-    doc.new_page()
-    doc.save(pdf_path)
-    doc.close()
+    pdf_path.write_bytes(_blank_pdf_bytes(3))
 
     # Create test data with page indices
     job_id = "test-job-789"
@@ -652,10 +854,7 @@ def test_generate_manifest_without_page_indices(tmp_path):
     """Test that generate_manifest works without page indices."""
     # Create a temporary PDF for testing
     pdf_path = tmp_path / "test.pdf"
-    doc = fitz.open()
-    doc.new_page()
-    doc.save(pdf_path)
-    doc.close()
+    pdf_path.write_bytes(_blank_pdf_bytes(1))
 
     # Create test data without page indices
     job_id = "test-job-000"
@@ -758,6 +957,63 @@ def test_add_page_number_no_overlap_with_running_headers():
     doc.close()
 
 
+def _front_matter_pdf(page_count, with_raw_image=False):
+    """A separately opened document with its own embedded font, like a cover."""
+    font_path = Path(__file__).parent.parent / "fonts" / "RobotoCondensed-Regular.ttf"
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_font(fontname="rc", fontfile=str(font_path))
+        page.insert_text((50, 50), f"Front matter page {i}", fontname="rc")
+        if with_raw_image:
+            pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 300, 300), False)
+            pixmap.set_rect(pixmap.irect, (200, 120, 30))
+            page.insert_image(fitz.Rect(100, 400, 400, 700), pixmap=pixmap)
+    # tobytes() without deflate leaves the image stream uncompressed.
+    return fitz.open("pdf", doc.tobytes())
+
+
+def test_save_songbook_pdf_size_matches_ez_save(tmp_path):
+    """The fast save stays within 1% of ez_save on a cover + TOC + songs book."""
+
+    def _build():
+        songbook = fitz.open()
+        songbook.insert_pdf(_front_matter_pdf(1, with_raw_image=True))
+        songbook.insert_pdf(_front_matter_pdf(2))
+        songbook.insert_pdf(_front_matter_pdf(4))
+        with fitz.open(TEST_DATA_DIR / "sample_songbook.pdf") as songs:
+            songbook.insert_pdf(songs)
+        songbook.insert_pdf(_front_matter_pdf(1, with_raw_image=True))
+        return songbook
+
+    fast_path = tmp_path / "fast.pdf"
+    ez_path = tmp_path / "ez.pdf"
+    _save_songbook_pdf(_build(), fast_path)
+    _build().ez_save(ez_path)
+
+    assert fast_path.stat().st_size <= ez_path.stat().st_size * 1.01
+    with fitz.open(fast_path) as saved:
+        for xref in range(1, saved.xref_length()):
+            if saved.xref_get_key(xref, "Subtype") == ("name", "/Image"):
+                assert saved.xref_get_key(xref, "Filter")[0] != "null"
+
+
+@pytest.mark.parametrize(
+    "difficulty_bin, expected_symbol",
+    [("3", "◑"), ("0", None), ("9", None), ("-1", None), ("x", None), (None, None)],
+)
+def test_add_difficulty_wheel(difficulty_bin, expected_symbol):
+    """Only valid, in-range bins stamp a difficulty symbol on the page."""
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    properties = {} if difficulty_bin is None else {"difficulty_bin": difficulty_bin}
+
+    add_difficulty_wheel(page, File(id="1", name="Song", properties=properties))
+
+    text = page.get_text().strip()
+    assert text == (expected_symbol or "")
+
+
 # ---------------------------------------------------------------------------
 # categorize_folder_files tests
 # ---------------------------------------------------------------------------
@@ -1441,6 +1697,7 @@ def test_copy_pdfs_looks_up_by_file_id(mocker):
 
     mock_cache = mocker.Mock()
     mock_cache.get.return_value = cached_pdf_bytes
+    mock_cache.local_path.return_value = None
 
     mock_step = mocker.Mock()
 
@@ -1453,6 +1710,92 @@ def test_copy_pdfs_looks_up_by_file_id(mocker):
     dest.close()
 
 
+def test_copy_pdfs_inserts_each_song_in_one_call(mocker):
+    """Each song's page range is copied with a single insert_pdf call."""
+    doc = fitz.open()
+    for _ in range(5):
+        doc.new_page()
+    doc.set_toc([[1, "a", 1], [1, "b", 3]])
+    cached_pdf_bytes = doc.tobytes()
+    doc.close()
+
+    mock_cache = mocker.Mock()
+    mock_cache.get.return_value = cached_pdf_bytes
+    mock_cache.local_path.return_value = None
+    dest = fitz.open()
+    insert_spy = mocker.spy(dest, "insert_pdf")
+
+    copy_pdfs(
+        dest,
+        [File(id="b", name="B"), File(id="a", name="A")],
+        mock_cache,
+        page_offset=0,
+        progress_step=mocker.Mock(),
+    )
+
+    assert len(dest) == 5
+    assert [
+        (c.kwargs["from_page"], c.kwargs["to_page"]) for c in insert_spy.call_args_list
+    ] == [(2, 4), (0, 1)]
+    dest.close()
+
+
+def test_copy_pdfs_opens_local_cache_in_place(mocker, tmp_path):
+    """A cache on local disk is opened by path rather than read into memory."""
+    cache = LocalStorageCache(LocalFileSystem(), str(tmp_path))
+    cache.put("merged-pdf/latest.pdf", _make_merged_pdf_with_toc("song_id"))
+    mock_get = mocker.spy(cache, "get")
+    dest = fitz.open()
+
+    copy_pdfs(
+        dest,
+        [File(id="song_id", name="Song")],
+        cache,
+        page_offset=0,
+        progress_step=mocker.Mock(),
+    )
+
+    assert len(dest) == 1
+    mock_get.assert_not_called()
+    dest.close()
+
+
+def test_copy_pdfs_copies_each_songs_page_range(mocker):
+    """Multi-page songs are copied in full, in the requested order."""
+    doc = fitz.open()
+    for label in ["a1", "b1", "b2", "b3", "c1", "c2"]:
+        doc.new_page().insert_text((72, 72), label)
+    doc.set_toc([[1, "a", 1], [1, "b", 2], [1, "c", 5]])
+    cached_pdf_bytes = doc.tobytes()
+    doc.close()
+
+    mock_cache = mocker.Mock()
+    mock_cache.get.return_value = cached_pdf_bytes
+    mock_cache.local_path.return_value = None
+    dest = fitz.open()
+
+    files = [File(id="c", name="C"), File(id="a", name="A"), File(id="b", name="B")]
+    copy_pdfs(
+        dest,
+        files,
+        mock_cache,
+        page_offset=0,
+        progress_step=mocker.Mock(),
+        add_page_numbers=False,
+        add_difficulty_wheels=False,
+    )
+
+    assert [page.get_text().strip() for page in dest] == [
+        "c1",
+        "c2",
+        "a1",
+        "b1",
+        "b2",
+        "b3",
+    ]
+    dest.close()
+
+
 def test_copy_pdfs_misses_when_id_absent_even_if_name_matches(mocker):
     """A file whose ID is not in the TOC raises PdfCacheMissException,
     even if the TOC happens to contain the file's name as an entry title
@@ -1462,6 +1805,7 @@ def test_copy_pdfs_misses_when_id_absent_even_if_name_matches(mocker):
 
     mock_cache = mocker.Mock()
     mock_cache.get.return_value = cached_pdf_bytes
+    mock_cache.local_path.return_value = None
 
     mock_step = mocker.Mock()
     dest = fitz.open()
@@ -1485,6 +1829,7 @@ def test_copy_pdfs_custom_file_with_same_name_misses_cache(mocker):
 
     mock_cache = mocker.Mock()
     mock_cache.get.return_value = cached_pdf_bytes
+    mock_cache.local_path.return_value = None
 
     mock_step = mocker.Mock()
     dest = fitz.open()
@@ -1535,6 +1880,7 @@ def test_copy_pdfs_stamps_pride_flag_on_matching_song(mocker):
     def _run(decorations_arg):
         mock_cache = mocker.Mock()
         mock_cache.get.return_value = cached_pdf_bytes
+        mock_cache.local_path.return_value = None
         dest = fitz.open()
         copy_pdfs(
             dest,
@@ -1576,6 +1922,7 @@ def test_copy_pdfs_no_flag_for_unmatched_song(mocker):
 
     mock_cache = mocker.Mock()
     mock_cache.get.return_value = cached_pdf_bytes
+    mock_cache.local_path.return_value = None
     dest = fitz.open()
 
     copy_pdfs(
@@ -1595,6 +1942,7 @@ def test_copy_pdfs_raises_when_no_merged_cache(mocker):
     """PdfCacheNotFound is raised when the merged PDF is absent from cache."""
     mock_cache = mocker.Mock()
     mock_cache.get.return_value = None
+    mock_cache.local_path.return_value = None
 
     mock_step = mocker.Mock()
     dest = fitz.open()
@@ -1605,3 +1953,54 @@ def test_copy_pdfs_raises_when_no_merged_cache(mocker):
         copy_pdfs(dest, files, mock_cache, page_offset=0, progress_step=mock_step)
 
     dest.close()
+
+
+def test_copy_pdfs_links_title_at_top_of_page(mocker):
+    """The title at the top of a song's first page links back to the TOC."""
+    title = "Jolene - Dolly Parton"
+    mock_cache = mocker.Mock()
+    mock_cache.get.return_value = _make_merged_pdf_with_title("jolene_id", title)
+    mock_cache.local_path.return_value = None
+    dest = fitz.open()
+    dest.new_page()  # TOC page
+
+    copy_pdfs(
+        dest,
+        [File(id="jolene_id", name=title)],
+        mock_cache,
+        page_offset=1,
+        progress_step=mocker.Mock(),
+        toc_page_index=0,
+    )
+
+    links = dest[1].get_links()
+    assert len(links) == 1
+    assert links[0]["page"] == 0
+    dest.close()
+
+
+def test_copy_pdfs_links_title_below_header(mocker):
+    """A title that is not in the header is still found lower on the page."""
+    title = "Jolene - Dolly Parton"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, page.rect.height * 0.8), title, fontsize=20)
+    doc.set_toc([[1, "jolene_id", 1]])
+    mock_cache = mocker.Mock()
+    mock_cache.get.return_value = doc.tobytes()
+    mock_cache.local_path.return_value = None
+    doc.close()
+    dest = fitz.open()
+
+    copy_pdfs(
+        dest,
+        [File(id="jolene_id", name=title)],
+        mock_cache,
+        page_offset=0,
+        progress_step=mocker.Mock(),
+    )
+
+    links = dest[0].get_links()
+    assert len(links) == 1
+    assert links[0]["from"].y0 > dest[0].rect.height * 0.25
+    dest.close()
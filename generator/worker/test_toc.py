@@ -8,7 +8,7 @@ from .toc import (
 from .models import File
 from . import toc
 from . import badges
-from ..common.config import TocBadge, TocDecoration, TocSymbol
+from ..common.config import Toc, TocBadge, TocDecoration, TocSymbol
 from ..common.filters import PropertyFilter
 
 
@@ -778,3 +778,19 @@ def test_outline_and_links_resolve_to_the_same_pages():
     outline_pages = sorted(o[2] - 1 for o in outline)  # 1-based -> 0-based
     assert link_pages == outline_pages == [3, 4, 5]
     doc.close()
+
+
+@pytest.mark.parametrize("num_files", [0, 1, 139, 140, 141, 280, 281, 1000])
+@pytest.mark.parametrize(
+    "edition_toc_config",
+    [None, Toc(columns_per_page=3, line_spacing=20), Toc(title_height=200)],
+)
+def test_toc_page_count_matches_built_toc(num_files, edition_toc_config):
+    """The layout-derived page count agrees with the TOC actually built."""
+    files = [File(id=str(i), name=f"Song {i:04d}") for i in range(num_files)]
+
+    toc_pdf, _ = toc.build_table_of_contents(
+        files, edition_toc_config=edition_toc_config
+    )
+
+    assert toc.toc_page_count(files, edition_toc_config) == len(toc_pdf)
@@ -40,6 +40,21 @@ class TocEntry:
     """Full, untruncated song title, used for the native PDF outline/bookmarks."""
 
 
+# PyMuPDF's default new_page() size (A4 portrait).
+TOC_PAGE_RECT = fitz.Rect(0, 0, 595, 842)
+
+
+def _lines_per_column(config: Toc) -> int:
+    """Number of entry lines that fit in one TOC column."""
+    available_height = (
+        TOC_PAGE_RECT.height
+        - config.title_height
+        - config.margin_top
+        - config.margin_bottom
+    )
+    return int(available_height // config.line_spacing)
+
+
 class TocGenerator:
     """Generates table of contents PDF with multi-column, multi-page layout."""
 
@@ -235,17 +250,8 @@ class TocGenerator:
         if not files:
             return self.pdf
 
-        temp_page = self.pdf.new_page()
-        page_rect = temp_page.rect
-        self.pdf.delete_page(0)
-
-        available_height = (
-            page_rect.height
-            - self.config.title_height
-            - self.config.margin_top
-            - self.config.margin_bottom
-        )
-        lines_per_column = int(available_height // self.config.line_spacing)
+        page_rect = TOC_PAGE_RECT
+        lines_per_column = _lines_per_column(self.config)
         column_positions = [
             self.config.margin_left
             + col * (self.config.column_width + self.config.column_spacing)
@@ -319,6 +325,33 @@ class TocGenerator:
         return self.toc_entries
 
 
+def _resolve_toc_config(edition_toc_config: Optional[Toc]) -> Toc:
+    """Return the global TOC config with any edition-specific overrides."""
+    # Start with global config
+    config = get_settings().toc
+
+    # If edition-specific config is provided, merge it
+    if edition_toc_config:
+        # Create a new Toc object with updated fields
+        config_dict = config.model_dump()
+        edition_config_dict = edition_toc_config.model_dump(exclude_unset=True)
+        config_dict.update(edition_config_dict)
+        config = Toc(**config_dict)
+    return config
+
+
+def toc_page_count(files: List[File], edition_toc_config: Optional[Toc] = None) -> int:
+    """Return how many pages the TOC for *files* will take, without building it.
+
+    Every song takes one line, so the count follows from the layout alone.
+    """
+    if not files:
+        return 0
+    config = _resolve_toc_config(edition_toc_config)
+    entries_per_page = _lines_per_column(config) * config.columns_per_page
+    return -(-len(files) // entries_per_page)
+
+
 def build_table_of_contents(
     files: List[File],
     page_offset: int = 0,
@@ -332,16 +365,7 @@ def build_table_of_contents(
     with tracer.start_as_current_span("build_table_of_contents") as span:
         assign_difficulty_bins(files)
 
-        # Start with global config
-        config = get_settings().toc
-
-        # If edition-specific config is provided, merge it
-        if edition_toc_config:
-            # Create a new Toc object with updated fields
-            config_dict = config.model_dump()
-            edition_config_dict = edition_toc_config.model_dump(exclude_unset=True)
-            config_dict.update(edition_config_dict)
-            config = Toc(**config_dict)
+        config = _resolve_toc_config(edition_toc_config)
 
         span.set_attributes(
             {